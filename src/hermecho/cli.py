@@ -7,7 +7,9 @@ from typing import Optional, Sequence
 from dotenv import load_dotenv
 
 from .pipeline import PipelineConfig, process_video
-from .video_processing import is_ffmpeg_installed
+from .transcription import WHISPER_BATCH_SIZE, WHISPER_COMPUTE_TYPES, WHISPER_DEVICES
+from .translation import CHUNK_SIZE, TRANSLATION_CONCURRENCY
+from .video_processing import HWACCEL_CHOICES, is_ffmpeg_installed
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -36,6 +38,24 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="With the full pipeline, also write a source-language SRT before translation.",
     )
     parser.add_argument("--model", default="large", help="The Whisper model for transcription.")
+    parser.add_argument(
+        "--whisper_device",
+        default="auto",
+        choices=WHISPER_DEVICES,
+        help="Device for Whisper inference (default: CUDA when available, else CPU).",
+    )
+    parser.add_argument(
+        "--compute_type",
+        default=None,
+        choices=WHISPER_COMPUTE_TYPES,
+        help="Whisper weight/compute precision (default: float16 on CUDA, int8 on CPU).",
+    )
+    parser.add_argument(
+        "--whisper_batch_size",
+        type=int,
+        default=WHISPER_BATCH_SIZE,
+        help="Number of VAD chunks Whisper decodes per batch; 1 disables batching.",
+    )
     parser.add_argument(
         "--language",
         default=None,
@@ -51,6 +71,24 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default="deepseek/deepseek-v4-pro",
         help="OpenRouter model slug for translation.",
     )
+    parser.add_argument(
+        "--translation_concurrency",
+        type=int,
+        default=TRANSLATION_CONCURRENCY,
+        help="Maximum OpenRouter translation chunks in flight at once.",
+    )
+    parser.add_argument(
+        "--translation_chunk_size",
+        type=int,
+        default=CHUNK_SIZE,
+        help="Segments per OpenRouter request when translating long transcripts in chunks.",
+    )
+    parser.add_argument(
+        "--no_translation_cache",
+        dest="translation_cache",
+        action="store_false",
+        help="Always call OpenRouter instead of reusing cached chunk translations.",
+    )
     parser.add_argument("--time_buffer", type=float, default=0.1, help="Buffer time between subtitles in seconds.")
     parser.add_argument("--input_dir", default="input", help="The directory where the input video is located.")
     parser.add_argument("--output_dir", default="output", help="The directory where the output files will be saved.")
@@ -79,6 +117,12 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         choices=list(range(1, 10)),
         help="Subtitle alignment using ASS numpad layout.",
     )
+    parser.add_argument(
+        "--hwaccel",
+        default="auto",
+        choices=HWACCEL_CHOICES,
+        help="Hardware video decode/encode for burn-in; auto falls back to libx264.",
+    )
     parser.add_argument(
         "--stage-cooldown",
         type=int,
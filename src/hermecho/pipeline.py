@@ -1,8 +1,10 @@
 """End-to-end video translation pipeline orchestration."""
 from __future__ import annotations
 
+import contextlib
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -17,7 +19,7 @@ from .subtitles import (
     limit_portrait_subtitle_lines,
     split_long_segments,
 )
-from .transcription import transcribe_audio
+from .transcription import prefetch_whisper_model, transcribe_audio
 from .translation import translate_segments
 from .utils import _print_segments, load_reference_material
 from .video_processing import burn_subtitles_into_video, extract_audio, is_portrait_video
@@ -30,9 +32,15 @@ class PipelineConfig:
     srt_only: bool = False
     save_source_transcript: bool = False
     model: str = "large"
+    whisper_device: str = "auto"
+    compute_type: Optional[str] = None
+    whisper_batch_size: int = 8
     language: Optional[str] = None
     target_language: str = "Traditional Chinese (Taiwan)"
     translation_model: str = "deepseek/deepseek-v4-pro"
+    translation_concurrency: int = 8
+    translation_chunk_size: int = 200
+    translation_cache: bool = True
     time_buffer: float = 0.1
     input_dir: str = "input"
     output_dir: str = "output"
@@ -46,6 +54,7 @@ class PipelineConfig:
     margin_v: int = 20
     margin_h: int = 10
     alignment: int = 2
+    hwaccel: str = "auto"
     stage_cooldown: int = 60
 
 
@@ -80,8 +89,25 @@ def process_video(config: PipelineConfig) -> None:
         stage += 1
         _stage_banner(stage, total_stages, label)
 
-    next_stage("Extracting Audio")
+    # Load Whisper weights while ffmpeg extracts the audio track.
+    prefetch_whisper_model(config.model, config.compute_type, config.whisper_device)
+
     video_path = os.path.abspath(os.path.join(config.input_dir, config.video_filename))
+    video_name = os.path.splitext(config.video_filename)[0]
+    output_dir = os.path.abspath(os.path.join(config.output_dir, video_name))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_prefix = os.path.join(output_dir, f"{video_name}_{timestamp}")
+
+    # The orientation probe and reference file are only needed for
+    # translation, so they run alongside extraction and transcription.
+    portrait_future = reference_future = None
+    if not config.transcribe_only:
+        side_tasks = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hermecho-prep")
+        portrait_future = side_tasks.submit(is_portrait_video, video_path)
+        reference_future = side_tasks.submit(load_reference_material, config.reference_file)
+        side_tasks.shutdown(wait=False)
+
+    next_stage("Extracting Audio")
     emit_progress("audio_extraction", "running", "Extracting audio")
     audio_path = extract_audio(video_path)
     if not audio_path:
@@ -97,6 +123,9 @@ def process_video(config: PipelineConfig) -> None:
             model=config.model,
             language=config.language,
             temperature=config.temperature,
+            compute_type=config.compute_type,
+            batch_size=config.whisper_batch_size,
+            device=config.whisper_device,
         )
         if not transcribed_segments:
             emit_progress("transcription", "error", "Audio transcription failed")
@@ -121,14 +150,11 @@ def process_video(config: PipelineConfig) -> None:
         transcribed_segments = fill_transcription_gaps(transcribed_segments)
         _print_segments("Transcription after Gap-Filling", transcribed_segments)
 
-        video_name = os.path.splitext(config.video_filename)[0]
-        output_dir = os.path.join(config.output_dir, video_name)
         os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if config.transcribe_only:
             next_stage("Writing Transcript SRT")
-            srt_path = os.path.join(output_dir, f"{video_name}_{timestamp}_transcript.srt")
+            srt_path = f"{output_prefix}_transcript.srt"
             emit_progress("source_srt_write", "running", "Writing transcript SRT")
             generate_srt(transcribed_segments, srt_path)
             emit_progress(
@@ -142,14 +168,11 @@ def process_video(config: PipelineConfig) -> None:
             emit_progress("completion", "complete", "Hermecho pipeline completed", pct=100)
             return
 
-        is_portrait = is_portrait_video(video_path)
-        reference_material = load_reference_material(config.reference_file)
+        is_portrait = portrait_future.result()
+        reference_material = reference_future.result()
 
         if config.save_source_transcript:
-            source_srt = os.path.join(
-                output_dir,
-                f"{video_name}_{timestamp}_transcript_source.srt",
-            )
+            source_srt = f"{output_prefix}_transcript_source.srt"
             emit_progress("source_srt_write", "running", "Writing source transcript SRT")
             generate_srt(transcribed_segments, source_srt)
             emit_progress(
@@ -172,6 +195,9 @@ def process_video(config: PipelineConfig) -> None:
             translation_model=config.translation_model,
             reference_material=reference_material,
             preserve_punctuation=is_portrait,
+            concurrency=config.translation_concurrency,
+            use_cache=config.translation_cache,
+            chunk_size=config.translation_chunk_size,
         )
 
         if translated_segments:
@@ -210,7 +236,7 @@ def process_video(config: PipelineConfig) -> None:
             _print_segments("Adjusted Subtitles", final_subtitle_segments)
 
             next_stage("Writing Subtitle SRT")
-            srt_path = os.path.join(output_dir, f"{video_name}_{timestamp}_subtitles.srt")
+            srt_path = f"{output_prefix}_subtitles.srt"
             emit_progress("translated_srt_write", "running", "Writing translated SRT")
             generate_srt(final_subtitle_segments, srt_path)
             emit_progress(
@@ -226,14 +252,10 @@ def process_video(config: PipelineConfig) -> None:
                 emit_progress("completion", "complete", "Hermecho pipeline completed", pct=100)
             else:
                 next_stage("Burning Subtitles into Video")
-                output_video_path = os.path.join(
-                    output_dir,
-                    f"{video_name}_{timestamp}_translated.mp4",
-                )
                 burn_subtitles_into_video(
                     video_path,
-                    os.path.abspath(srt_path),
-                    os.path.abspath(output_video_path),
+                    srt_path,
+                    f"{output_prefix}_translated.mp4",
                     font_name=config.font_name,
                     fonts_dir=config.fonts_dir,
                     font_size=config.font_size,
@@ -242,11 +264,12 @@ def process_video(config: PipelineConfig) -> None:
                     margin_v=config.margin_v,
                     margin_h=config.margin_h,
                     alignment=config.alignment,
+                    hwaccel=config.hwaccel,
                 )
                 emit_progress("completion", "complete", "Hermecho pipeline completed", pct=100)
         else:
             emit_progress("translation", "error", "Translation failed")
 
     finally:
-        if os.path.exists(audio_path):
+        with contextlib.suppress(FileNotFoundError):
             os.remove(audio_path)
@@ -4,9 +4,24 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from tqdm import tqdm
+
 PROGRESS_PREFIX = "HERMECHO_PROGRESS "
 
 
+def locked_print(*args: Any) -> None:
+    """
+    ``print`` for output that may come from worker threads.
+
+    print() writes the text and the newline separately, so lines from
+    concurrent threads can run together. Holding tqdm's write lock, which
+    ``tqdm.write`` and progress-bar refreshes also take, keeps each line
+    whole.
+    """
+    with tqdm.get_lock():
+        print(*args)
+
+
 def emit_progress(
     stage: str,
     status: str,
@@ -20,4 +35,4 @@ def emit_progress(
         "message": message,
     }
     event.update({key: value for key, value in fields.items() if value is not None})
-    print(f"{PROGRESS_PREFIX}{json.dumps(event, ensure_ascii=False)}")
+    locked_print(f"{PROGRESS_PREFIX}{json.dumps(event, ensure_ascii=False)}")
@@ -2,23 +2,17 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
-def build_translation_prompt(
-    chunk_segments: List[Dict],
+@lru_cache(maxsize=8)
+def _translation_prompt_preamble(
     target_language: str,
     reference_material: Optional[str],
-    context: Dict[str, str],
 ) -> str:
-    """Build the strict JSON translation prompt for a segment chunk."""
-    main_text_dict = {str(i): seg["text"] for i, seg in enumerate(chunk_segments)}
-    main_text_json = json.dumps({"segments": main_text_dict}, ensure_ascii=False)
-
-    prev_context = context.get("prev", "")
-    next_context = context.get("next", "")
-
-    prompt_text = (
+    """Build the rules and reference block shared by every chunk of a run."""
+    preamble = (
         f"You are an expert translator and editor specializing in Korean to {target_language}.\n"
         "Your task is two-fold: \n"
         "1. Translate a JSON array of Korean strings. \n"
@@ -51,20 +45,37 @@ def build_translation_prompt(
     )
 
     if reference_material:
-        prompt_text += (
+        preamble += (
             "\nReference Material for specific terms:\n"
             f"---\n{reference_material}\n---\n"
         )
+    return preamble
 
-    prompt_text += (
-        "\nPrevious Context (for context, do not translate):\n"
-        f"---\n{prev_context}\n---\n"
+
+def build_translation_prompt(
+    chunk_segments: List[Dict],
+    target_language: str,
+    reference_material: Optional[str],
+    context: Dict[str, str],
+) -> str:
+    """Build the strict JSON translation prompt for a segment chunk."""
+    main_text_dict = {str(i): seg["text"] for i, seg in enumerate(chunk_segments)}
+    main_text_json = json.dumps({"segments": main_text_dict}, ensure_ascii=False)
+
+    prev_context = context.get("prev", "")
+    next_context = context.get("next", "")
+
+    # The preamble is identical for every chunk of a run, so it is built once
+    # and cached; keeping the chunk-specific text after it also lets
+    # providers with prompt caching reuse the shared prefix.
+    return _translation_prompt_preamble(target_language, reference_material) + (
         "\nMain Text to Translate (JSON Array):\n"
         f"---\n{main_text_json}\n---\n"
+        "\nPrevious Context (for context, do not translate):\n"
+        f"---\n{prev_context}\n---\n"
         "\nNext Context (for context, do not translate):\n"
         f"---\n{next_context}\n---\n"
         "\nYour output MUST be exactly this JSON object shape and nothing else:\n"
         f'{{"translations": {{"0": "<{target_language} string for segment 0>", "1": "<{target_language} string for segment 1>", ...}}}}\n'
         f'The dict must have exactly {len(chunk_segments)} key(s), one string index per input segment ("0" through "{len(chunk_segments) - 1}").'
     )
-    return prompt_text
@@ -3,6 +3,7 @@ This module contains functions for generating, adjusting, and cleaning subtitles
 """
 import logging
 import math
+from itertools import pairwise
 from typing import Dict, List
 
 PORTRAIT_SUBTITLE_LINE_LENGTH = 12
@@ -164,39 +165,42 @@ def split_long_segments(segments: List[Dict], max_chars: int = 40, max_duration:
             continue
             
         # Split logic: Try to split into chunks that fit constraints
+        word_count = len(words)
         current_chunk_words = []
+        # Length of the stripped chunk text, kept incrementally so the
+        # look-ahead does not re-join the chunk for every word.
+        current_chunk_chars = 0
         current_chunk_start = words[0]["start"]
-        
+
         for i, word_info in enumerate(words):
+            word = word_info["word"]
+            current_chunk_chars += len(word) if current_chunk_words else len(word.lstrip())
             current_chunk_words.append(word_info)
-            
-            # Check if adding this word exceeds limits relative to chunk start
-            chunk_text = "".join([w["word"] for w in current_chunk_words]).strip()
-            chunk_duration = word_info["end"] - current_chunk_start
-            
+
             # Look ahead to see if next word would break the limit
             next_word_breaks = False
-            if i + 1 < len(words):
-                next_word = words[i+1]
-                next_text_len = len(chunk_text) + len(next_word["word"])
+            if i + 1 < word_count:
+                next_word = words[i + 1]
+                next_text_len = current_chunk_chars + len(next_word["word"])
                 next_duration = next_word["end"] - current_chunk_start
                 if next_text_len > max_chars or next_duration > max_duration:
                     next_word_breaks = True
-            
+
             # If we need to split here (either current is long enough, or next breaks it)
             # But ensure we have at least something in the chunk
-            if next_word_breaks or i == len(words) - 1:
+            if next_word_breaks or i == word_count - 1:
                 split_segments.append({
-                    "text": chunk_text,
+                    "text": "".join(w["word"] for w in current_chunk_words).strip(),
                     "start": current_chunk_start,
                     "end": word_info["end"],
                     "words": current_chunk_words
                 })
                 # Reset for next chunk
-                if i + 1 < len(words):
-                    current_chunk_start = words[i+1]["start"]
+                if i + 1 < word_count:
+                    current_chunk_start = words[i + 1]["start"]
                     current_chunk_words = []
-                    
+                    current_chunk_chars = 0
+
     return split_segments
 
 
@@ -208,9 +212,9 @@ def fill_transcription_gaps(
     """
     Identifies and fills significant time gaps in a transcription with placeholder text.
 
-    This function iterates through the transcribed segments and checks the time difference
-    between the end of one segment and the start of the next. If the gap exceeds the
-    specified threshold, a new placeholder segment is inserted.
+    This function checks the time difference between the end of each segment and the
+    start of the next. Where the gap exceeds the specified threshold, a new placeholder
+    segment is inserted.
 
     Args:
         transcribed_segments: The list of transcription segments from Whisper.
@@ -223,25 +227,39 @@ def fill_transcription_gaps(
     if not transcribed_segments:
         return []
 
-    filled_segments = [transcribed_segments[0]]
-    for i in range(len(transcribed_segments) - 1):
-        current_seg = transcribed_segments[i]
-        next_seg = transcribed_segments[i + 1]
-
-        gap = next_seg["start"] - current_seg["end"]
+    # Locate the gaps in one pass, then copy the runs between them with
+    # slice extends so only the (usually few) gaps cost a Python iteration.
+    gap_indices = [
+        i
+        for i, (current_seg, next_seg) in enumerate(pairwise(transcribed_segments))
+        if next_seg["start"] - current_seg["end"] > gap_threshold
+    ]
+
+    filled_segments: List[Dict] = []
+    gaps: List[float] = []
+    run_start = 0
+    for i in gap_indices:
+        gap_start = transcribed_segments[i]["end"]
+        gap_end = transcribed_segments[i + 1]["start"]
+        gaps.append(gap_end - gap_start)
+        filled_segments.extend(transcribed_segments[run_start:i + 1])
+        filled_segments.append({
+            "text": placeholder,
+            "start": gap_start,
+            "end": gap_end
+        })
+        run_start = i + 1
+    filled_segments.extend(transcribed_segments[run_start:])
+
+    # One summary instead of a log record per gap.
+    if gaps:
+        logging.warning(
+            "Detected %d gap(s) totaling %.2fs (longest %.2fs). Inserted placeholders.",
+            len(gaps),
+            sum(gaps),
+            max(gaps),
+        )
 
-        if gap > gap_threshold:
-            logging.warning(
-                f"Gap of {gap:.2f}s detected. Inserting placeholder."
-            )
-            filled_segments.append({
-                "text": placeholder,
-                "start": current_seg["end"],
-                "end": next_seg["start"]
-            })
-        
-        filled_segments.append(next_seg)
-    
     return filled_segments
 
 
@@ -266,26 +284,31 @@ def adjust_subtitle_timing(segments: List[Dict], time_buffer: float) -> List[Dic
 
     adjusted_segments = [seg.copy() for seg in segments]
 
-    for i in range(len(adjusted_segments) - 1):
-        current_segment = adjusted_segments[i]
-        next_segment = adjusted_segments[i + 1]
+    for current_segment, next_segment in pairwise(adjusted_segments):
+        # End each cue a buffer before the next one starts. This extends shorter
+        # segments and shortens longer ones. If the gap is smaller than the buffer,
+        # clamp to the start time so the subtitle appears as a flash rather than
+        # getting a negative duration.
+        current_segment['end'] = max(
+            next_segment['start'] - time_buffer,
+            current_segment['start'],
+        )
+
+    # The last segment's end time is not modified as there's no next segment to overlap with.
 
-        # The ideal end time for the current segment is the start of the next one minus the buffer.
-        new_end_time = next_segment['start'] - time_buffer
+    return adjusted_segments
 
-        # Update the end time. This extends shorter segments and shortens longer ones.
-        current_segment['end'] = new_end_time
 
-        # Ensure that the new end time does not precede the start time.
-        if current_segment['end'] < current_segment['start']:
-            # This can happen if the gap between segments is smaller than the time_buffer.
-            # To avoid a negative or zero duration, we set the end time to be same as the start time,
-            # which will make the subtitle appear as a flash. This is a safe fallback.
-            current_segment['end'] = current_segment['start']
+_SRT_TIMESTAMP_FORMAT = "%02d:%02d:%02d,%03d"
 
-    # The last segment's end time is not modified as there's no next segment to overlap with.
 
-    return adjusted_segments
+def _format_srt_timestamp(seconds: float) -> str:
+    """Formats seconds as an SRT ``HH:MM:SS,mmm`` timestamp."""
+    hours, remainder = divmod(round(seconds * 1000), 3_600_000)
+    minutes, remainder = divmod(remainder, 60_000)
+    # A single %-format on a fixed-width template formats all four fields in
+    # one C-level call instead of four separate f-string format specs.
+    return _SRT_TIMESTAMP_FORMAT % (hours, minutes, *divmod(remainder, 1000))
 
 
 def generate_srt(
@@ -299,17 +322,12 @@ def generate_srt(
         segments: A list of segments with text, start, and end times.
         output_path: The path to save the .srt file.
     """
+    blocks = [
+        f"{index}\n"
+        f"{_format_srt_timestamp(seg['start'])} --> {_format_srt_timestamp(seg['end'])}\n"
+        f"{seg['text']}\n\n"
+        for index, seg in enumerate(segments, start=1)
+    ]
     with open(output_path, "w", encoding="utf-8") as f:
-        for i, seg in enumerate(segments):
-            start_time = seg["start"]
-            end_time = seg["end"]
-            text = seg["text"]
-
-            # SRT time format: HH:MM:SS,ms
-            start_srt = f"{int(start_time // 3600):02}:{int((start_time % 3600) // 60):02}:{int(start_time % 60):02},{int((start_time % 1) * 1000):03}"
-            end_srt = f"{int(end_time // 3600):02}:{int((end_time % 3600) // 60):02}:{int(end_time % 60):02},{int((end_time % 1) * 1000):03}"
-
-            f.write(f"{i + 1}\n")
-            f.write(f"{start_srt} --> {end_srt}\n")
-            f.write(f"{text}\n\n")
+        f.write("".join(blocks))
     print(f"SRT file generated at {output_path}")
@@ -2,7 +2,164 @@
 Local Whisper transcription.
 """
 import os
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from .progress import emit_progress
+
+WHISPER_COMPUTE_TYPES = ("float32", "float16", "int8", "int8_float16")
+WHISPER_DEVICES = ("auto", "cuda", "cpu")
+WHISPER_BATCH_SIZE = 8
+
+# Whisper's silence and repetition guards. The sequential decoder applies
+# them itself; batched output is filtered with the same values afterwards.
+_NO_SPEECH_THRESHOLD = 0.85
+_LOG_PROB_THRESHOLD = -1.0  # faster-whisper's default
+_COMPRESSION_RATIO_THRESHOLD = 1.7
+
+# Loaded faster-whisper models keyed by (model name, device, compute type),
+# reused across calls.
+_MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
+# Serializes loads so a background prefetch and transcribe_audio never load
+# the same weights twice; the second caller waits and reuses the first load.
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _select_device() -> str:
+    """Return "cuda" when CTranslate2 can see a GPU, otherwise "cpu"."""
+    import ctranslate2  # type: ignore
+
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def _load_whisper_model(
+    model: str,
+    compute_type: Optional[str] = None,
+    device: str = "auto",
+) -> Any:
+    """
+    Load a faster-whisper model, reusing a previously loaded instance.
+
+    ``device`` "auto" picks CUDA when available. ``compute_type`` defaults to
+    float16 on CUDA and int8 on CPU. Weights download to ``$WHISPER_CACHE``
+    when set, otherwise to the Hugging Face cache.
+    """
+    if device == "auto":
+        device = _select_device()
+    if compute_type is None:
+        compute_type = "float16" if device == "cuda" else "int8"
+    cache_key = (model, device, compute_type)
+    with _MODEL_CACHE_LOCK:
+        whisper_model = _MODEL_CACHE.get(cache_key)
+        if whisper_model is not None:
+            return whisper_model
+
+        from faster_whisper import WhisperModel  # type: ignore
+
+        print(f"Loading local Whisper model ({model}, {device}, {compute_type})...")
+        whisper_model = WhisperModel(
+            model,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=os.cpu_count() or 0,
+            download_root=os.environ.get("WHISPER_CACHE"),
+        )
+        _MODEL_CACHE[cache_key] = whisper_model
+        return whisper_model
+
+
+def prefetch_whisper_model(
+    model: str,
+    compute_type: Optional[str] = None,
+    device: str = "auto",
+) -> None:
+    """
+    Starts loading a Whisper model in a background thread.
+
+    Lets the weight load overlap earlier work such as audio extraction.
+    ``transcribe_audio`` reuses the cached model, waiting for an in-flight
+    load if needed. Load errors are left for ``transcribe_audio`` to report.
+    """
+    def _load() -> None:
+        try:
+            _load_whisper_model(model, compute_type, device)
+        except Exception:
+            pass
+
+    threading.Thread(target=_load, name="whisper-prefetch", daemon=True).start()
+
+
+def _segment_to_dict(segment: Any) -> Dict:
+    """Convert a faster-whisper segment into the pipeline's segment dict."""
+    return {
+        "text": segment.text,
+        "start": segment.start,
+        "end": segment.end,
+        "words": [
+            {"word": word.word, "start": word.start, "end": word.end}
+            for word in segment.words or []
+        ],
+    }
+
+
+def _collect_segments(segments: Iterable[Any], duration: Optional[float]) -> List[Dict]:
+    """
+    Drain faster-whisper's lazy segment generator, reporting progress as
+    each segment is decoded rather than after the whole track finishes.
+    """
+    total_sec = int(duration) if duration else None
+    result_segments: List[Dict] = []
+    with tqdm(total=total_sec, desc="Transcribing", unit="s", dynamic_ncols=True) as pbar:
+        last_sec = 0
+        for segment in segments:
+            result_segments.append(_segment_to_dict(segment))
+            current_sec = int(segment.end)
+            if total_sec:
+                current_sec = min(current_sec, total_sec)
+            if current_sec <= last_sec:
+                continue
+            pbar.update(current_sec - last_sec)
+            last_sec = current_sec
+            emit_progress(
+                "transcription",
+                "running",
+                (
+                    f"Transcribing audio {current_sec}/{total_sec}s"
+                    if total_sec
+                    else f"Transcribing audio {current_sec}s"
+                ),
+                current=current_sec,
+                total=total_sec,
+                pct=min(100, int(current_sec / total_sec * 100)) if total_sec else None,
+            )
+    return result_segments
+
+
+def _drop_hallucinated_segments(segments: Iterable[Any]) -> Iterator[Any]:
+    """
+    Filter batched Whisper output the way the sequential decoder would.
+
+    ``BatchedInferencePipeline`` decodes at one temperature and never checks
+    ``no_speech_threshold`` or ``compression_ratio_threshold``. Segments that
+    are probably silence (high ``no_speech_prob`` and low ``avg_logprob``,
+    the sequential skip rule) or repetitive text (high ``compression_ratio``)
+    are dropped here instead.
+    """
+    for segment in segments:
+        no_speech_prob = getattr(segment, "no_speech_prob", None)
+        avg_logprob = getattr(segment, "avg_logprob", None)
+        compression_ratio = getattr(segment, "compression_ratio", None)
+        if (
+            no_speech_prob is not None
+            and no_speech_prob > _NO_SPEECH_THRESHOLD
+            and (avg_logprob is None or avg_logprob <= _LOG_PROB_THRESHOLD)
+        ):
+            continue
+        if compression_ratio is not None and compression_ratio > _COMPRESSION_RATIO_THRESHOLD:
+            continue
+        yield segment
 
 
 def transcribe_audio(
@@ -10,35 +167,54 @@ def transcribe_audio(
     model: str,
     language: Optional[str],
     temperature: float = 0.0,
+    compute_type: Optional[str] = None,
+    batch_size: int = WHISPER_BATCH_SIZE,
+    device: str = "auto",
 ) -> Optional[List[Dict]]:
     """
-    Transcribes audio using the local OpenAI Whisper model.
+    Transcribes audio locally with faster-whisper (CTranslate2).
+
+    With ``batch_size`` > 1, VAD-split chunks are decoded together through
+    faster-whisper's ``BatchedInferencePipeline`` and silent or repetitive
+    segments are filtered after decoding; 1 decodes sequentially with the
+    checks inside the decoder.
     """
     try:
         if not os.path.exists(audio_path):
             print(f"Error: Audio file not found at {audio_path}")
             return None
 
-        import whisper  # type: ignore
+        whisper_model = _load_whisper_model(model, compute_type, device)
+        transcribe_kwargs: Dict[str, Any] = {}
+        if batch_size > 1:
+            from faster_whisper import BatchedInferencePipeline  # type: ignore
 
-        print(f"Loading local Whisper model ({model})...")
-        whisper_model = whisper.load_model(model)
+            whisper_model = BatchedInferencePipeline(model=whisper_model)
+            transcribe_kwargs["batch_size"] = batch_size
+            # The batched pipeline defaults to one segment per ~30 s VAD
+            # chunk; keep Whisper's own segment boundaries as cue breaks.
+            transcribe_kwargs["without_timestamps"] = False
 
         print(f"Transcribing audio locally (language: {language or 'auto'})...")
-        result = whisper_model.transcribe(  # type: ignore
+        segments, info = whisper_model.transcribe(
             audio_path,
             language=language,
             word_timestamps=True,
-            verbose=True,
-            fp16=False,
+            vad_filter=True,
+            # Greedy decoding, as openai-whisper did; faster-whisper defaults to beam 5.
+            beam_size=1,
             temperature=temperature,
             condition_on_previous_text=False,
-            no_speech_threshold=0.85,
-            compression_ratio_threshold=1.7,
+            no_speech_threshold=_NO_SPEECH_THRESHOLD,
+            compression_ratio_threshold=_COMPRESSION_RATIO_THRESHOLD,
+            **transcribe_kwargs,
         )
+        if batch_size > 1:
+            segments = _drop_hallucinated_segments(segments)
+        result_segments = _collect_segments(segments, getattr(info, "duration", None))
 
-        if not result["segments"]:
-            detected_language = result.get("language", "unknown")
+        if not result_segments:
+            detected_language = getattr(info, "language", None) or "unknown"
             print("Warning: Whisper model returned no transcription segments.")
             print(f"  - Detected language: {detected_language}")
             print(
@@ -49,8 +225,20 @@ def transcribe_audio(
 
         print("Audio transcribed successfully")
         print("Transcription: local Whisper (no API token usage).")
-        return result["segments"]
+        return result_segments
 
     except (FileNotFoundError, RuntimeError) as e:
         print(f"An error occurred during local audio transcription: {e}")
         return None
+    except ValueError as e:
+        # CTranslate2 rejects a device or compute type this host cannot run,
+        # such as cuda with a CPU-only build or float16 on a CPU.
+        print(
+            f"Error: Whisper cannot run on device '{device}' with compute type "
+            f"'{compute_type or 'default'}': {e}"
+        )
+        print(
+            "  - Use --whisper_device auto or cpu, and omit --compute_type to "
+            "use the device default (int8 on CPU)."
+        )
+        return None
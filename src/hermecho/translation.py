@@ -1,25 +1,39 @@
 """
 This module contains functions for translating text using OpenRouter.
 """
+import contextlib
+import hashlib
 import json
 import os
 import random
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional, Tuple
 
 from tqdm import tqdm
 
-from .progress import emit_progress
+from .progress import emit_progress, locked_print
 from .prompts import build_translation_prompt
 
 
 # Constants for the sliding window approach
-# Approximate character threshold for a single translation request.
-TOKEN_THRESHOLD = 128000  # Max characters to send in a single prompt
+TOKEN_THRESHOLD = 128000  # Max estimated tokens to send in a single prompt
 CHUNK_SIZE = 200          # Number of segments per chunk, increased for better performance
 OVERLAP_SIZE = 3         # Number of segments to overlap
 
+TRANSLATION_CONCURRENCY = 8  # Max sliding-window chunks in flight at once
+
 _MAX_TRANSLATION_ATTEMPTS = 3
+# Landscape subtitles show full-width commas and periods as spaces.
+_PUNCTUATION_TO_SPACE = str.maketrans({"，": " ", "。": " "})
+# Per-request timeout (seconds) so a stalled OpenRouter call cannot hang a chunk.
+_TRANSLATION_REQUEST_TIMEOUT = 300.0
+# Headroom for the prompt rules and JSON framing around the segment text.
+_PROMPT_OVERHEAD_TOKENS = 1000
+# Sub-chunk sizes tried, in order, when a sliding-window chunk fails.
+_FALLBACK_CHUNK_SIZES = (50, 10)
 
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
@@ -30,6 +44,49 @@ OPENROUTER_PROVIDER_ROUTING = {
 }
 
 
+class _TranslationAPIUnavailable(Exception):
+    """Every attempt at a chunk failed with a transient API error."""
+
+    def __init__(
+        self,
+        message: str,
+        usage: Optional[Dict[str, Any]] = None,
+        timed_out: bool = False,
+    ):
+        super().__init__(message)
+        self.usage = usage
+        # True when the last attempt timed out rather than being refused.
+        self.timed_out = timed_out
+
+
+def _is_transient_api_error(exc: Exception) -> bool:
+    """True for connection, timeout, rate-limit, and 5xx errors from the openai SDK."""
+    try:
+        import openai
+    except ImportError:
+        return False
+    transient_types = tuple(
+        error_type
+        for error_type in (
+            getattr(openai, "APIConnectionError", None),  # includes APITimeoutError
+            getattr(openai, "RateLimitError", None),
+            getattr(openai, "InternalServerError", None),
+        )
+        if isinstance(error_type, type)
+    )
+    return isinstance(exc, transient_types)
+
+
+def _is_api_timeout(exc: Exception) -> bool:
+    """True when the openai SDK gave up waiting for a response."""
+    try:
+        import openai
+    except ImportError:
+        return False
+    timeout_type = getattr(openai, "APITimeoutError", None)
+    return isinstance(timeout_type, type) and isinstance(exc, timeout_type)
+
+
 def _translation_retry_delay(attempt: int) -> float:
     delay = min(2.5 * (2 ** attempt), 120.0)
     return max(0.0, delay * (1.0 + random.uniform(-0.25, 0.25)))
@@ -47,7 +104,77 @@ def _make_openrouter_client() -> Any:
             "`openai` is required for translation. Install project dependencies "
             "with `python -m pip install -e .`."
         ) from exc
-    return OpenAI(api_key=api_key, base_url=OPENROUTER_BASE_URL)
+    # _translate_chunk owns retries; the SDK's own (2 by default) would multiply
+    # them, stretching a stalled chunk to 9 requests of up to 300s each.
+    return OpenAI(api_key=api_key, base_url=OPENROUTER_BASE_URL, max_retries=0)
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Rough BPE token count without a tokenizer dependency.
+
+    ASCII text averages about four characters per token, while Hangul and
+    CJK characters each cost roughly one token.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _translation_cache_dir() -> str:
+    """Return ``$HERMECHO_CACHE_DIR/translations`` (default ``~/.cache/hermecho``)."""
+    cache_root = os.environ.get("HERMECHO_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "hermecho"
+    )
+    return os.path.join(cache_root, "translations")
+
+
+def _translation_cache_path(translation_model: str, prompt_text: str) -> str:
+    """
+    Cache file for one request. The prompt already embeds the target
+    language, reference material, chunk text, and context, so hashing it
+    with the model slug identifies the request exactly.
+    """
+    digest = hashlib.sha256(
+        f"{translation_model}\n{prompt_text}".encode("utf-8")
+    ).hexdigest()
+    return os.path.join(_translation_cache_dir(), f"{digest}.json")
+
+
+def _read_cached_translation(
+    cache_path: str,
+    expected_count: int,
+) -> Optional[List[str]]:
+    """Return cached translations, or None when missing or unusable."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            translations = json.load(f).get("translations")
+    except (OSError, ValueError, AttributeError):
+        return None
+    if (
+        isinstance(translations, list)
+        and len(translations) == expected_count
+        and all(isinstance(item, str) for item in translations)
+    ):
+        return translations
+    return None
+
+
+def _write_cached_translation(cache_path: str, translations: List[str]) -> None:
+    """Atomically store translations so concurrent or interrupted runs never see partial files."""
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"translations": translations}, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+    except OSError as exc:
+        locked_print(f"Warning: Could not write translation cache: {exc}")
 
 
 def _merge_api_usage_tokens(
@@ -69,7 +196,7 @@ def _log_translation_api_tokens(
 ) -> None:
     """Print token usage from an OpenAI-compatible chat completion response."""
     if not usage:
-        print(f"{label}: (no usage metadata)")
+        locked_print(f"{label}: (no usage metadata)")
         return
     pt = usage.get("prompt_tokens")
     ct = usage.get("completion_tokens")
@@ -82,9 +209,9 @@ def _log_translation_api_tokens(
     if tt is not None:
         parts.append(f"total_tokens={tt}")
     if parts:
-        print(f"{label}: " + ", ".join(parts))
+        locked_print(f"{label}: " + ", ".join(parts))
     else:
-        print(f"{label}: usage={usage!r}")
+        locked_print(f"{label}: usage={usage!r}")
 
 
 def _read_usage_field(usage: Any, key: str) -> Optional[int]:
@@ -186,6 +313,8 @@ def _translate_chunk(
     translation_model: str,
     reference_material: Optional[str],
     context: Dict[str, str],
+    use_cache: bool = False,
+    client: Any = None,
 ) -> Tuple[Optional[List[str]], Optional[Dict[str, Any]]]:
     """
     Translates a single chunk of subtitle segments using OpenRouter.
@@ -199,9 +328,17 @@ def _translate_chunk(
         translation_model: The OpenRouter model slug to use.
         reference_material: Optional reference text to guide the translation.
         context: A dictionary containing 'prev' and 'next' text for context.
+        use_cache: Reuse and store complete translations in the on-disk
+            response cache, keyed on the model and full prompt.
+        client: OpenRouter client to reuse; one is created when omitted.
 
     Returns:
         (translated strings, token_usage) or (None, usage) on failure.
+
+    Raises:
+        _TranslationAPIUnavailable: The last attempt failed with a network,
+            timeout, rate-limit, or server error, so splitting the chunk
+            would not help.
     """
     prompt_text = build_translation_prompt(
         chunk_segments=chunk_segments,
@@ -210,18 +347,28 @@ def _translate_chunk(
         context=context,
     )
 
-    try:
-        client = _make_openrouter_client()
-    except (RuntimeError, ValueError) as exc:
-        print(f"Error: {exc}")
-        return None, None
+    cache_path = (
+        _translation_cache_path(translation_model, prompt_text) if use_cache else None
+    )
+    if cache_path:
+        cached = _read_cached_translation(cache_path, len(chunk_segments))
+        if cached is not None:
+            locked_print("Translation: reused cached response (no API token usage).")
+            return cached, None
+
+    if client is None:
+        try:
+            client = _make_openrouter_client()
+        except (RuntimeError, ValueError) as exc:
+            locked_print(f"Error: {exc}")
+            return None, None
 
     last_usage: Optional[Dict[str, Any]] = None
 
     for attempt in range(_MAX_TRANSLATION_ATTEMPTS):
         if attempt > 0:
             delay = _translation_retry_delay(attempt - 1)
-            print(
+            locked_print(
                 f"Translation: attempt {attempt + 1}/{_MAX_TRANSLATION_ATTEMPTS} "
                 f"retrying in {delay:.1f}s..."
             )
@@ -234,6 +381,7 @@ def _translate_chunk(
                 temperature=0,
                 response_format={"type": "json_object"},
                 extra_body={"provider": OPENROUTER_PROVIDER_ROUTING},
+                timeout=_TRANSLATION_REQUEST_TIMEOUT,
             )
             usage = _usage_from_openai_response(response)
             last_usage = usage
@@ -246,7 +394,7 @@ def _translate_chunk(
             )
 
             if translated_segments is None:
-                print(
+                locked_print(
                     "Warning: Could not extract translations array from response. "
                     f"Keys present: {list(response_json.keys()) if isinstance(response_json, dict) else type(response_json).__name__}"
                 )
@@ -256,7 +404,7 @@ def _translate_chunk(
 
             if len(translated_segments) != len(chunk_segments):
                 non_empty = sum(1 for t in translated_segments if t)
-                print(
+                locked_print(
                     f"Warning: Mismatch in segment count for a chunk. "
                     f"Expected {len(chunk_segments)}, got {len(translated_segments)} "
                     f"({non_empty} non-empty)."
@@ -270,6 +418,10 @@ def _translate_chunk(
                     return padded, usage
                 return None, usage
 
+            # Dict replies are padded with "" for missing indices; only a
+            # complete translation is worth replaying on later runs.
+            if cache_path and all(translated_segments):
+                _write_cached_translation(cache_path, translated_segments)
             return translated_segments, usage
 
         except json.JSONDecodeError as exc:
@@ -278,7 +430,7 @@ def _translate_chunk(
                 response_text_preview = _message_content_from_openai_response(response)[:200]  # type: ignore[possibly-undefined]
             except Exception:
                 pass
-            print(
+            locked_print(
                 f"Warning: Failed to decode JSON from the model's response: {exc}. "
                 f"Preview: {response_text_preview!r}"
             )
@@ -286,20 +438,115 @@ def _translate_chunk(
                 continue
             return None, last_usage
         except Exception as e:
-            print(f"An unexpected error occurred during chunk translation: {e}")
+            locked_print(f"An unexpected error occurred during chunk translation: {e}")
             if attempt + 1 < _MAX_TRANSLATION_ATTEMPTS:
                 continue
+            if _is_transient_api_error(e):
+                raise _TranslationAPIUnavailable(
+                    str(e), last_usage, timed_out=_is_api_timeout(e)
+                ) from e
             return None, last_usage
 
     return None, last_usage
 
 
+def _translate_chunk_with_fallback(
+    chunk: List[Dict],
+    target_language: str,
+    translation_model: str,
+    reference_material: Optional[str],
+    context: Dict[str, str],
+    api_slots: Optional[threading.Semaphore] = None,
+    fallback_sizes: Tuple[int, ...] = _FALLBACK_CHUNK_SIZES,
+    label: str = "Chunk",
+    use_cache: bool = False,
+    client: Any = None,
+) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Translates one sliding-window chunk, splitting it on failure.
+
+    A failed chunk is split into pieces of the next size in
+    ``fallback_sizes`` (50, then 10 segments), and all pieces of a split are
+    translated concurrently. Pieces that fail at the smallest size are left
+    untranslated as empty strings.
+
+    Args:
+        api_slots: Optional semaphore held around each API call, bounding
+            total in-flight requests across chunks and their splits.
+
+    Returns:
+        (translated strings, accumulated token usage for this chunk).
+    """
+    usage_totals: Dict[str, int] = {}
+    try:
+        with api_slots if api_slots is not None else contextlib.nullcontext():
+            translated_chunk, u = _translate_chunk(
+                chunk,
+                target_language,
+                translation_model,
+                reference_material,
+                context,
+                use_cache=use_cache,
+                client=client,
+            )
+    except _TranslationAPIUnavailable as exc:
+        # Smaller requests will not get past an unreachable or overloaded
+        # API; splitting would only multiply the failing calls.
+        _merge_api_usage_tokens(usage_totals, exc.usage)
+        tqdm.write(
+            f"Error: {label} failed after retries ({exc}). "
+            "Skipping translation for this section."
+        )
+        return [""] * len(chunk), usage_totals
+    _merge_api_usage_tokens(usage_totals, u)
+    if translated_chunk is not None:
+        return translated_chunk, usage_totals
+
+    if not fallback_sizes:
+        tqdm.write(
+            f"Error: {label} failed. Skipping translation for this small section."
+        )
+        return [""] * len(chunk), usage_totals
+
+    split_size, smaller_sizes = fallback_sizes[0], fallback_sizes[1:]
+    tqdm.write(
+        f"Warning: {label} failed. Splitting into sub-chunks (size {split_size})."
+    )
+
+    def _translate_piece(offset: int) -> Tuple[List[str], Dict[str, int]]:
+        return _translate_chunk_with_fallback(
+            chunk[offset: offset + split_size],
+            target_language,
+            translation_model,
+            reference_material,
+            context,
+            api_slots=api_slots,
+            fallback_sizes=smaller_sizes,
+            label=f"{label} sub-chunk at {offset}",
+            use_cache=use_cache,
+            client=client,
+        )
+
+    offsets = range(0, len(chunk), split_size)
+    with ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+        pieces = list(executor.map(_translate_piece, offsets))
+
+    translated_chunk = []
+    for piece_translation, piece_usage in pieces:
+        translated_chunk.extend(piece_translation)
+        _merge_api_usage_tokens(usage_totals, piece_usage)
+    return translated_chunk, usage_totals
+
+
 def translate_segments(
     segments: List[Dict],
     target_language: str,
     translation_model: str,
     reference_material: Optional[str],
     preserve_punctuation: bool = False,
+    concurrency: int = TRANSLATION_CONCURRENCY,
+    use_cache: bool = False,
+    chunk_size: int = CHUNK_SIZE,
 ) -> Optional[List[Dict]]:
     """
     Translates transcribed text segments using an optimized, two-layer strategy.
@@ -313,25 +560,46 @@ def translate_segments(
         target_language: The target language for the translation.
         translation_model: The OpenRouter model slug to use for translation.
         reference_material: Optional reference text for context-aware translation.
+        concurrency: Maximum number of sliding-window chunks translated at once.
+        use_cache: Reuse complete translations from earlier runs via the
+            on-disk response cache.
+        chunk_size: Segments per sliding-window chunk.
 
     Returns:
         A list of translated segments, or None if a critical error occurs.
     """
     print("Translating text using an optimized strategy...")
+    # One client for every chunk so its connection pool (and TLS sessions)
+    # is shared instead of reconnecting for each request.
+    try:
+        client = _make_openrouter_client()
+    except (RuntimeError, ValueError) as exc:
+        print(f"Error: {exc}")
+        emit_progress(
+            "translation",
+            "error",
+            "Translation client unavailable",
+            detail=str(exc),
+        )
+        return None
+
     translated_segments_text = []
     num_segments = len(segments)
 
-    # Calculate the total length to decide on the translation strategy
-    full_text = "\n".join([seg["text"] for seg in segments])
-    # A rough estimation of the overhead from the prompt template and reference material
-    prompt_overhead = len(reference_material or "") + 1000
-    total_length = len(full_text) + prompt_overhead
+    # Read each segment's text once; the chunk contexts below slice this list.
+    texts = [seg["text"] for seg in segments]
+    # Estimate the prompt size in tokens to decide on the translation strategy
+    estimated_tokens = (
+        _estimate_tokens("\n".join(texts))
+        + _estimate_tokens(reference_material or "")
+        + _PROMPT_OVERHEAD_TOKENS
+    )
 
     try:
         use_sliding_window = False
         usage_totals: Dict[str, int] = {}
 
-        if total_length < TOKEN_THRESHOLD:
+        if estimated_tokens < TOKEN_THRESHOLD:
             print(
                 "Text is short enough. Attempting to translate in a "
                 "single batch."
@@ -348,19 +616,30 @@ def translate_segments(
                     "running",
                     "Translating single batch",
                 )
-                translated_segments_text, chunk_usage = _translate_chunk(
-                    segments,
-                    target_language,
-                    translation_model,
-                    reference_material,
-                    context={},
-                )
+                try:
+                    translated_segments_text, chunk_usage = _translate_chunk(
+                        segments,
+                        target_language,
+                        translation_model,
+                        reference_material,
+                        context={},
+                        use_cache=use_cache,
+                        client=client,
+                    )
+                except _TranslationAPIUnavailable as exc:
+                    # A whole-transcript request may simply be too slow, so
+                    # smaller sliding-window requests are still worth trying.
+                    # Rate limits and server errors are not about size: send
+                    # those windows one at a time instead of adding load.
+                    translated_segments_text, chunk_usage = None, exc.usage
+                    if not exc.timed_out:
+                        concurrency = 1
                 pbar.update(1)
             _merge_api_usage_tokens(usage_totals, chunk_usage)
 
             if translated_segments_text is None:
                 print(
-                    "Single batch translation failed (likely segment mismatch). "
+                    "Single batch translation failed. "
                     "Falling back to sliding window strategy."
                 )
                 use_sliding_window = True
@@ -371,7 +650,12 @@ def translate_segments(
         # Strategy 2: Sliding Window (Chunks)
         if use_sliding_window:
             translated_segments_text = []
-            num_chunks = (num_segments + CHUNK_SIZE - 1) // CHUNK_SIZE
+            chunk_size = max(1, chunk_size)
+            num_chunks = (num_segments + chunk_size - 1) // chunk_size
+            # Only split failed chunks into pieces smaller than the chunk itself.
+            fallback_sizes = tuple(
+                size for size in _FALLBACK_CHUNK_SIZES if size < chunk_size
+            )
             emit_progress(
                 "translation_strategy",
                 "running",
@@ -379,25 +663,18 @@ def translate_segments(
                 total=num_chunks,
             )
 
-            for i in tqdm(
-                range(num_chunks),
-                desc="Translating in chunks",
-                unit="chunk",
-            ):
-                start_index = i * CHUNK_SIZE
-                end_index = min(start_index + CHUNK_SIZE, num_segments)
+            def _translate_window(i: int) -> Tuple[List[str], Dict[str, int]]:
+                start_index = i * chunk_size
+                end_index = min(start_index + chunk_size, num_segments)
                 chunk = segments[start_index:end_index]
 
                 # Define context
                 prev_start = max(0, start_index - OVERLAP_SIZE)
-                prev_context_segments = segments[prev_start:start_index]
-                next_start = end_index
-                next_end = min(next_start + OVERLAP_SIZE, num_segments)
-                next_context_segments = segments[next_start:next_end]
+                next_end = min(end_index + OVERLAP_SIZE, num_segments)
 
                 context = {
-                    'prev': "\n".join([seg["text"] for seg in prev_context_segments]),
-                    'next': "\n".join([seg["text"] for seg in next_context_segments])
+                    'prev': "\n".join(texts[prev_start:start_index]),
+                    'next': "\n".join(texts[end_index:next_end])
                 }
 
                 emit_progress(
@@ -407,74 +684,53 @@ def translate_segments(
                     current=i + 1,
                     total=num_chunks,
                 )
-                translated_chunk, u = _translate_chunk(
+                return _translate_chunk_with_fallback(
                     chunk,
                     target_language,
                     translation_model,
                     reference_material,
                     context,
+                    api_slots=api_slots,
+                    fallback_sizes=fallback_sizes,
+                    label=f"Chunk {i}",
+                    use_cache=use_cache,
+                    client=client,
                 )
-                _merge_api_usage_tokens(usage_totals, u)
 
-                if translated_chunk is None:
-                    tqdm.write(
-                        f"Warning: Chunk {i} failed. Attempting to split "
-                        "into smaller sub-chunks (size 50)."
-                    )
-                    translated_chunk = []
-                    sub_chunk_size = 50
-
-                    for j in range(0, len(chunk), sub_chunk_size):
-                        sub_chunk = chunk[j: j + sub_chunk_size]
-                        sub_result, su = _translate_chunk(
-                            sub_chunk,
-                            target_language,
-                            translation_model,
-                            reference_material,
-                            context,
+            # Chunks are independent network-bound calls, so up to
+            # `concurrency` of them are in flight at once. Results are
+            # collected as they finish and reassembled in chunk order.
+            chunk_results: List[Optional[List[str]]] = [None] * num_chunks
+            # Fallback splits fan out further, so the API call itself is
+            # also capped at `concurrency` across every chunk and split.
+            api_slots = threading.BoundedSemaphore(max(1, concurrency))
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                futures = {
+                    executor.submit(_translate_window, i): i
+                    for i in range(num_chunks)
+                }
+                for future in tqdm(
+                    as_completed(futures),
+                    total=num_chunks,
+                    desc="Translating in chunks",
+                    unit="chunk",
+                ):
+                    i = futures[future]
+                    translated_chunk, chunk_usage = future.result()
+                    _merge_api_usage_tokens(usage_totals, chunk_usage)
+                    chunk_results[i] = translated_chunk
+                    if translated_chunk:
+                        emit_progress(
+                            "translation",
+                            "complete",
+                            f"Translated chunk {i + 1}/{num_chunks}",
+                            current=i + 1,
+                            total=num_chunks,
                         )
-                        _merge_api_usage_tokens(usage_totals, su)
-
-                        if sub_result is None:
-                            tqdm.write(
-                                f"  Warning: Sub-chunk starting at {j} "
-                                "failed. Splitting into mini-chunks "
-                                "(size 10)."
-                            )
-                            mini_chunk_size = 10
-
-                            for k in range(0, len(sub_chunk), mini_chunk_size):
-                                mini_chunk = sub_chunk[k: k + mini_chunk_size]
-                                mini_result, mu = _translate_chunk(
-                                    mini_chunk,
-                                    target_language,
-                                    translation_model,
-                                    reference_material,
-                                    context,
-                                )
-                                _merge_api_usage_tokens(usage_totals, mu)
-
-                                if mini_result is None:
-                                    tqdm.write(
-                                        f"    Error: Mini-chunk starting "
-                                        f"at {k} failed. Skipping translation "
-                                        "for this small section."
-                                    )
-                                    translated_chunk.extend([""] * len(mini_chunk))
-                                else:
-                                    translated_chunk.extend(mini_result)
-                        else:
-                            translated_chunk.extend(sub_result)
 
+            for translated_chunk in chunk_results:
                 if translated_chunk:
                     translated_segments_text.extend(translated_chunk)
-                    emit_progress(
-                        "translation",
-                        "complete",
-                        f"Translated chunk {i + 1}/{num_chunks}",
-                        current=i + 1,
-                        total=num_chunks,
-                    )
 
         _log_translation_api_tokens(
             "Translation API tokens — cumulative (reported chunks)",
@@ -484,25 +740,22 @@ def translate_segments(
         if translated_segments_text is None:
             translated_segments_text = []
 
+        # Segments past the end of a short translation get empty text.
+        translated_segments_text = translated_segments_text + [""] * (
+            num_segments - len(translated_segments_text)
+        )
         final_segments = []
-        for i, segment in enumerate(segments):
-            translated_segment = segment.copy()
-            original_text = segment.get("text", "").strip()
-            translated_segment["source_text"] = original_text
-
+        for segment, source_text, translated_text in zip(
+            segments, texts, translated_segments_text
+        ):
+            original_text = source_text.strip()
             if original_text == "[no speech]":
-                translated_segment["text"] = ""
-            elif i < len(translated_segments_text):
-                translated_text = translated_segments_text[i]
-                if not preserve_punctuation:
-                    translated_text = translated_text.replace("，", " ").replace(
-                        "。", " "
-                    )
-                translated_text = translated_text.strip()
-                translated_segment["text"] = translated_text
-            else:
-                translated_segment["text"] = ""
-            final_segments.append(translated_segment)
+                translated_text = ""
+            elif not preserve_punctuation:
+                translated_text = translated_text.translate(_PUNCTUATION_TO_SPACE)
+            final_segments.append(
+                {**segment, "text": translated_text.strip(), "source_text": original_text}
+            )
 
         print("Text translated successfully.")
         emit_progress(
@@ -2,13 +2,24 @@
 This module contains utility functions for the video translator.
 """
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
+@lru_cache(maxsize=16)
+def _read_reference_file(file_path: str, mtime: float) -> str:
+    """Reads a reference file; ``mtime`` is part of the cache key so edits are picked up."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 def load_reference_material(file_path: str) -> Optional[str]:
     """
     Loads reference material from a file.
 
+    Contents are cached per path and modification time, so repeated loads
+    of an unchanged file do not touch the disk again.
+
     Args:
         file_path: The path to the reference file.
 
@@ -21,8 +32,7 @@ def load_reference_material(file_path: str) -> Optional[str]:
         return None
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return _read_reference_file(file_path, os.path.getmtime(file_path))
     except (FileNotFoundError, IOError) as e:
         print(f"An error occurred while reading the reference file: {e}")
         return None
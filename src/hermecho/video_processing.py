@@ -3,14 +3,40 @@ This module contains functions for video and audio processing.
 """
 import json
 import os
+import shutil
 import subprocess
 import threading
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from tqdm import tqdm
 
 from .progress import emit_progress
 
+HWACCEL_CHOICES = ("auto", "cuda", "qsv", "videotoolbox", "none")
+
+# (hwaccel backend, H.264 encoder, encoder options) in auto-selection order.
+# The backend name doubles as the ffmpeg ``-hwaccel`` decode method.
+_HARDWARE_H264_ENCODERS = (
+    ("cuda", "h264_nvenc", ["-preset", "p4", "-cq", "23", "-pix_fmt", "yuv420p"]),
+    ("qsv", "h264_qsv", ["-global_quality", "23", "-pix_fmt", "nv12"]),
+    # Constant quality keeps output size proportional to resolution like CRF.
+    # Intel Macs' VideoToolbox rejects -q:v, so the probe sends them to libx264.
+    ("videotoolbox", "h264_videotoolbox", ["-q:v", "65", "-pix_fmt", "yuv420p"]),
+)
+_SOFTWARE_H264_ENCODER = ("libx264", ["-pix_fmt", "yuv420p"])
+
+# Containers that hold a stream-copied audio codec, keyed by ffprobe codec name.
+_COPY_AUDIO_EXTENSIONS = {
+    "aac": ".m4a",
+    "alac": ".m4a",
+    "mp3": ".mp3",
+    "opus": ".opus",
+    "vorbis": ".ogg",
+    "flac": ".flac",
+    "pcm_s16le": ".wav",
+}
+
 
 def _escape_filter_value(value: str) -> str:
     """
@@ -42,6 +68,86 @@ def _ffmpeg_supports_subtitles_filter() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
+def _ffmpeg_encoders_output() -> str:
+    """
+    Returns the text of ``ffmpeg -encoders``, or an empty string on failure.
+
+    Cached: the encoder list cannot change while the process runs.
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return ""
+    return result.stdout
+
+
+@lru_cache(maxsize=None)
+def _h264_encoder_works(encoder: str, options: Tuple[str, ...] = ()) -> bool:
+    """
+    Returns True if ``encoder`` can encode a frame with ``options`` on this machine.
+
+    ffmpeg builds often list hardware encoders whose device is absent, and
+    some builds reject individual rate-control flags, so a one-frame test
+    encode with the burn-in options is the reliable check. Results are
+    cached per encoder and options so repeated burn-ins probe only once.
+    """
+    command = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+        "-frames:v", "1",
+        "-c:v", encoder,
+        *options,
+        "-f", "null", "-",
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True, timeout=30)
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return False
+    return True
+
+
+def _select_h264_encoder(hwaccel: str = "auto") -> Tuple[str, Optional[str], List[str]]:
+    """
+    Picks the H.264 encoder for subtitle burn-in.
+
+    Args:
+        hwaccel: One of ``HWACCEL_CHOICES``. ``auto`` tries NVENC, Quick Sync,
+            then VideoToolbox; ``none`` always uses libx264.
+
+    Returns:
+        (encoder name, ``-hwaccel`` decode method or None, encoder options).
+        Falls back to libx264 when the requested hardware is unavailable;
+        in ``auto`` mode decoding still uses ``-hwaccel auto``, which ffmpeg
+        silently drops when no decoder device exists.
+    """
+    software_encoder, software_options = _SOFTWARE_H264_ENCODER
+    if hwaccel == "none":
+        return software_encoder, None, software_options
+
+    candidates = [
+        entry for entry in _HARDWARE_H264_ENCODERS
+        if hwaccel == "auto" or entry[0] == hwaccel
+    ]
+    encoders_output = _ffmpeg_encoders_output()
+    for backend, encoder, options in candidates:
+        if f" {encoder} " in encoders_output and _h264_encoder_works(encoder, tuple(options)):
+            return encoder, backend, options
+
+    if hwaccel == "auto":
+        return software_encoder, "auto", software_options
+    print(
+        f"Warning: hardware acceleration '{hwaccel}' is unavailable; "
+        f"falling back to {software_encoder}."
+    )
+    return software_encoder, None, software_options
+
+
 def _build_subtitle_style_options(
     font_name: str,
     font_size: int,
@@ -136,12 +242,34 @@ def is_portrait_video(video_path: str) -> bool:
     return height > width
 
 
-def extract_audio(video_path: str) -> Optional[str]:
+def _audio_codec_name(video_path: str) -> Optional[str]:
+    """Returns the codec name of the first audio stream, or None if unknown."""
+    command = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        video_path,
+    ]
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True, timeout=30)
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def extract_audio(video_path: str, copy_codec: bool = False) -> Optional[str]:
     """
-    Extracts audio from a video file and saves it as an MP3 file.
+    Extracts the audio track of a video for transcription.
+
+    By default the track is decoded to 16 kHz mono 16-bit WAV, the format
+    Whisper consumes, which avoids running a lossy audio encoder. With
+    ``copy_codec`` the compressed stream is copied without re-encoding into
+    a container matching its codec; unrecognized codecs fall back to WAV.
 
     Args:
         video_path: The path to the video file.
+        copy_codec: Copy the source audio stream instead of decoding it.
 
     Returns:
         The path to the extracted audio file, or None if an error occurs.
@@ -154,14 +282,25 @@ def extract_audio(video_path: str) -> Optional[str]:
 
         # Generate audio path based on video filename to allow concurrent processing
         base_name = os.path.splitext(video_path)[0]
-        audio_path = f"{base_name}.mp3"
+        copy_extension = (
+            _COPY_AUDIO_EXTENSIONS.get(_audio_codec_name(video_path) or "")
+            if copy_codec
+            else None
+        )
+        if copy_extension:
+            audio_path = f"{base_name}{copy_extension}"
+            codec_options = ["-c:a", "copy"]
+        else:
+            audio_path = f"{base_name}.wav"
+            codec_options = ["-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le"]
 
         # Construct the ffmpeg command. -y overwrites the output file if it exists.
         command = [
             "ffmpeg",
             "-i", video_path,
-            "-q:a", "0",
-            "-map", "a",
+            "-vn",
+            "-map", "a:0",
+            *codec_options,
             "-y",
             audio_path
         ]
@@ -186,6 +325,97 @@ def extract_audio(video_path: str) -> Optional[str]:
         return None
 
 
+def _build_burn_command(
+    video_path: str,
+    subtitles_filter: str,
+    output_video_path: str,
+    encoder: str,
+    decode_hwaccel: Optional[str],
+    encoder_options: List[str],
+) -> List[str]:
+    # The subtitles filter renders on system-memory frames, so hardware
+    # decode outputs are downloaded before the filter and re-uploaded by
+    # the hardware encoder.
+    command = ["ffmpeg"]
+    if decode_hwaccel:
+        command += ["-hwaccel", decode_hwaccel]
+    command += [
+        "-i", video_path,
+        "-vf", subtitles_filter,
+        "-c:v", encoder,  # H.264 codec for wide compatibility
+        *encoder_options,
+        "-c:a", "aac",      # AAC audio codec for wide compatibility
+        "-strict", "experimental",
+        "-progress", "pipe:1",
+        "-nostats",
+        output_video_path,
+        "-y",  # Overwrite output file if it exists
+    ]
+    return command
+
+
+def _run_burn_command(command: List[str], duration: Optional[float]) -> Tuple[int, str]:
+    """
+    Runs a burn-in ffmpeg command, reporting progress from ``-progress pipe:1``.
+
+    Returns:
+        (ffmpeg exit code, captured stderr).
+    """
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+
+    stderr_lines: List[str] = []
+
+    def _drain_stderr() -> None:
+        if process.stderr:
+            for line in process.stderr:
+                stderr_lines.append(line)
+
+    stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
+    stderr_thread.start()
+
+    total_sec = int(duration) if duration else None
+    with tqdm(total=total_sec, desc="Burning subtitles", unit="s", dynamic_ncols=True) as pbar:
+        last_sec = 0
+        if process.stdout:
+            for line in process.stdout:
+                if line.startswith("out_time_us="):
+                    try:
+                        us = int(line.split("=", 1)[1].strip())
+                        if us >= 0:
+                            current_sec = us // 1_000_000
+                            delta = current_sec - last_sec
+                            if delta > 0:
+                                pbar.update(delta)
+                                last_sec = current_sec
+                                pct = None
+                                if total_sec:
+                                    pct = min(100, int((current_sec / total_sec) * 100))
+                                emit_progress(
+                                    "burn_in",
+                                    "running",
+                                    (
+                                        f"Burning subtitles {current_sec}/{total_sec}s"
+                                        if total_sec
+                                        else f"Burning subtitles {current_sec}s"
+                                    ),
+                                    current=current_sec,
+                                    total=total_sec,
+                                    pct=pct,
+                                )
+                    except (ValueError, IndexError):
+                        pass
+
+    process.wait()
+    stderr_thread.join(timeout=5.0)
+    return process.returncode, "".join(stderr_lines)
+
+
 def burn_subtitles_into_video(
     video_path: str,
     srt_path: str,
@@ -198,6 +428,7 @@ def burn_subtitles_into_video(
     margin_v: int = 20,
     margin_h: int = 10,
     alignment: int = 2,
+    hwaccel: str = "auto",
 ):
     """
     Burns subtitles from an SRT file into a video.
@@ -214,6 +445,7 @@ def burn_subtitles_into_video(
         margin_v: Vertical margin in pixels (distance from the frame edge).
         margin_h: Horizontal margin in pixels applied to both left and right.
         alignment: ASS numpad alignment (1–9); 2 = bottom-center (default).
+        hwaccel: Hardware decode/encode backend, one of ``HWACCEL_CHOICES``.
     """
     print(f"Burning subtitles into video: {output_video_path}")
     emit_progress(
@@ -261,77 +493,39 @@ def burn_subtitles_into_video(
     )
 
     duration = _video_duration_seconds(video_path)
-
-    command = [
-        "ffmpeg",
-        "-i", video_path,
-        "-vf", subtitles_filter,
-        "-c:v", "libx264",  # H.264 codec for wide compatibility
-        "-pix_fmt", "yuv420p",  # Pixel format for compatibility
-        "-c:a", "aac",      # AAC audio codec for wide compatibility
-        "-strict", "experimental",
-        "-progress", "pipe:1",
-        "-nostats",
-        output_video_path,
-        "-y",  # Overwrite output file if it exists
-    ]
+    encoder, decode_hwaccel, encoder_options = _select_h264_encoder(hwaccel)
 
     try:
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+        print(f"Encoding with {encoder}")
+        command = _build_burn_command(
+            video_path,
+            subtitles_filter,
+            output_video_path,
+            encoder,
+            decode_hwaccel,
+            encoder_options,
         )
+        returncode, stderr_output = _run_burn_command(command, duration)
+
+        software_encoder, software_options = _SOFTWARE_H264_ENCODER
+        if returncode != 0 and encoder != software_encoder:
+            # The probe encodes a synthetic frame; a real input can still
+            # trip the hardware path, so retry once on the CPU.
+            print(
+                f"Warning: {encoder} failed during burn-in; "
+                f"retrying with {software_encoder}."
+            )
+            command = _build_burn_command(
+                video_path,
+                subtitles_filter,
+                output_video_path,
+                software_encoder,
+                None,
+                software_options,
+            )
+            returncode, stderr_output = _run_burn_command(command, duration)
 
-        stderr_lines: List[str] = []
-
-        def _drain_stderr() -> None:
-            if process.stderr:
-                for line in process.stderr:
-                    stderr_lines.append(line)
-
-        stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
-        stderr_thread.start()
-
-        total_sec = int(duration) if duration else None
-        with tqdm(total=total_sec, desc="Burning subtitles", unit="s", dynamic_ncols=True) as pbar:
-            last_sec = 0
-            if process.stdout:
-                for line in process.stdout:
-                    if line.startswith("out_time_us="):
-                        try:
-                            us = int(line.split("=", 1)[1].strip())
-                            if us >= 0:
-                                current_sec = us // 1_000_000
-                                delta = current_sec - last_sec
-                                if delta > 0:
-                                    pbar.update(delta)
-                                    last_sec = current_sec
-                                    pct = None
-                                    if total_sec:
-                                        pct = min(100, int((current_sec / total_sec) * 100))
-                                    emit_progress(
-                                        "burn_in",
-                                        "running",
-                                        (
-                                            f"Burning subtitles {current_sec}/{total_sec}s"
-                                            if total_sec
-                                            else f"Burning subtitles {current_sec}s"
-                                        ),
-                                        current=current_sec,
-                                        total=total_sec,
-                                        pct=pct,
-                                    )
-                        except (ValueError, IndexError):
-                            pass
-
-        process.wait()
-        stderr_thread.join(timeout=5.0)
-
-        if process.returncode != 0:
-            stderr_output = "".join(stderr_lines)
+        if returncode != 0:
             print("An error occurred while running ffmpeg to burn subtitles:")
             print(f"Command: {' '.join(command)}")
             print(f"FFmpeg stderr: {stderr_output}")
@@ -368,16 +562,15 @@ def burn_subtitles_into_video(
         )
 
 
+@lru_cache(maxsize=1)
 def is_ffmpeg_installed() -> bool:
     """
     Checks if ffmpeg is installed and available in the system's PATH.
 
+    A PATH lookup is enough to prove presence, so no process is spawned;
+    the result is cached for the life of the process.
+
     Returns:
         True if ffmpeg is installed, False otherwise.
     """
-    try:
-        subprocess.run(["ffmpeg", "-version"], check=True,
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which("ffmpeg") is not None
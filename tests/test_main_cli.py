@@ -5,6 +5,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -46,6 +47,8 @@ class TestCliArguments(unittest.TestCase):
         self.assertIsInstance(config, PipelineConfig)
         self.assertEqual(config.video_filename, "clip.mp4")
         self.assertEqual(config.model, "large")
+        self.assertIsNone(config.compute_type)
+        self.assertEqual(config.whisper_batch_size, 8)
         self.assertIsNone(config.language)
         self.assertEqual(config.target_language, "Traditional Chinese (Taiwan)")
         self.assertEqual(config.translation_model, "deepseek/deepseek-v4-pro")
@@ -57,6 +60,7 @@ class TestCliArguments(unittest.TestCase):
         self.assertFalse(config.transcribe_only)
         self.assertFalse(config.srt_only)
         self.assertTrue(config.box_background)
+        self.assertTrue(config.translation_cache)
 
     def test_parse_args_preserves_fonts_dir(self) -> None:
         config = cli.config_from_args(
@@ -65,6 +69,16 @@ class TestCliArguments(unittest.TestCase):
 
         self.assertEqual(config.fonts_dir, "/tmp/pingfang")
 
+    def test_parse_args_accepts_whisper_compute_type(self) -> None:
+        config = cli.config_from_args(
+            cli.parse_args(["clip.mp4", "--compute_type", "int8_float16"])
+        )
+
+        self.assertEqual(config.compute_type, "int8_float16")
+
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            cli.parse_args(["clip.mp4", "--compute_type", "int4"])
+
     def test_compatibility_wrapper_delegates_to_package_cli(self) -> None:
         root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         wrapper_path = os.path.join(root, "src", "main.py")
@@ -81,6 +95,11 @@ class TestCliArguments(unittest.TestCase):
 
 
 class TestPipelineOrchestration(unittest.TestCase):
+    def setUp(self) -> None:
+        prefetch_patcher = patch("hermecho.pipeline.prefetch_whisper_model")
+        self.prefetch = prefetch_patcher.start()
+        self.addCleanup(prefetch_patcher.stop)
+
     def test_portrait_pipeline_limits_cues_and_uses_them_for_both_outputs(self) -> None:
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
             audio_path = tmp.name
@@ -182,9 +201,13 @@ class TestPipelineOrchestration(unittest.TestCase):
                 "margin_v": 20,
                 "margin_h": 10,
                 "alignment": 2,
+                "hwaccel": "auto",
             },
         )
         self.assertTrue(translate.call_args.kwargs["preserve_punctuation"])
+        self.assertEqual(translate.call_args.kwargs["concurrency"], 8)
+        self.assertTrue(translate.call_args.kwargs["use_cache"])
+        self.assertEqual(translate.call_args.kwargs["chunk_size"], 200)
 
     def test_default_pipeline_transcribes_with_whisper_and_adjusts_timing(self) -> None:
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
@@ -237,10 +260,53 @@ class TestPipelineOrchestration(unittest.TestCase):
             model="tiny",
             language="ko",
             temperature=0.0,
+            compute_type=None,
+            batch_size=8,
+            device="auto",
         )
+        self.prefetch.assert_called_once_with("tiny", None, "auto")
         adjust.assert_called_once_with(translated, 0.25)
         generate_srt.assert_called_once_with(adjusted, generate_srt.call_args.args[1])
 
+    def test_translation_inputs_are_prepared_during_transcription(self) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            audio_path = tmp.name
+            tmp.write(b"fake")
+
+        config = PipelineConfig(
+            video_filename="clip.mp4",
+            output_dir=tempfile.mkdtemp(),
+            srt_only=True,
+            stage_cooldown=0,
+        )
+        transcribed = [{"start": 0.0, "end": 1.0, "text": "hello"}]
+        translated = [{"start": 0.0, "end": 1.0, "text": "你好"}]
+        reference_loaded = threading.Event()
+
+        def load_reference(_path):
+            reference_loaded.set()
+            return "reference"
+
+        def transcribe(*_args, **_kwargs):
+            # Only finishes once the reference has been read in the background.
+            self.assertTrue(reference_loaded.wait(timeout=5))
+            return transcribed
+
+        try:
+            with patch("hermecho.pipeline.extract_audio", return_value=audio_path), \
+                patch("hermecho.pipeline.transcribe_audio", side_effect=transcribe), \
+                patch("hermecho.pipeline.translate_segments", return_value=translated) as translate, \
+                patch("hermecho.pipeline.generate_srt"), \
+                patch("hermecho.pipeline.is_portrait_video", return_value=True), \
+                patch("hermecho.pipeline.load_reference_material", side_effect=load_reference):
+                cli.process_video(config)
+        finally:
+            if os.path.exists(audio_path):
+                os.unlink(audio_path)
+
+        self.assertEqual(translate.call_args.kwargs["reference_material"], "reference")
+        self.assertTrue(translate.call_args.kwargs["preserve_punctuation"])
+
     @patch.dict(sys.modules, {"timing_review": None})
     def test_full_pipeline_does_not_import_or_call_timing_review(self) -> None:
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
@@ -0,0 +1,47 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from tqdm import tqdm
+
+from hermecho.progress import emit_progress
+
+
+class TestEmitProgress(unittest.TestCase):
+
+    def test_event_is_one_prefixed_json_line(self) -> None:
+        with patch("builtins.print") as mock_print:
+            emit_progress("translation", "running", "Translating chunk 1/2", current=1, pct=None)
+
+        line = mock_print.call_args.args[0]
+        self.assertTrue(line.startswith("HERMECHO_PROGRESS "))
+        self.assertEqual(
+            json.loads(line.removeprefix("HERMECHO_PROGRESS ")),
+            {
+                "stage": "translation",
+                "status": "running",
+                "message": "Translating chunk 1/2",
+                "current": 1,
+            },
+        )
+
+    def test_worker_thread_events_wait_for_the_write_lock(self) -> None:
+        with patch("builtins.print") as mock_print:
+            with tqdm.get_lock():
+                worker = threading.Thread(
+                    target=emit_progress,
+                    args=("translation", "running", "Translating chunk 1/2"),
+                )
+                worker.start()
+                worker.join(timeout=0.2)
+                # Another thread's line is still being written.
+                self.assertTrue(worker.is_alive())
+                mock_print.assert_not_called()
+            worker.join(timeout=5)
+
+        mock_print.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Unit tests for subtitle segment post-processing and SRT output.
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hermecho.subtitles import (
+    _format_srt_timestamp,
+    adjust_subtitle_timing,
+    fill_transcription_gaps,
+    generate_srt,
+    split_long_segments,
+)
+
+
+class TestSplitLongSegments(unittest.TestCase):
+
+    def test_splits_at_word_boundaries_by_character_budget(self) -> None:
+        words = [
+            {"word": " alpha", "start": 0.0, "end": 0.5},
+            {"word": " beta", "start": 0.5, "end": 1.0},
+            {"word": " gamma", "start": 1.0, "end": 1.5},
+            {"word": " delta", "start": 1.5, "end": 2.0},
+        ]
+        segment = {
+            "text": " alpha beta gamma delta",
+            "start": 0.0,
+            "end": 2.0,
+            "words": words,
+        }
+
+        result = split_long_segments([segment], max_chars=12, max_duration=7.0)
+
+        self.assertEqual(
+            [(seg["text"], seg["start"], seg["end"]) for seg in result],
+            [("alpha beta", 0.0, 1.0), ("gamma delta", 1.0, 2.0)],
+        )
+        self.assertEqual(result[0]["words"], words[:2])
+        self.assertEqual(result[1]["words"], words[2:])
+
+    def test_splits_when_next_word_exceeds_duration(self) -> None:
+        segment = {
+            "text": " one two",
+            "start": 0.0,
+            "end": 9.0,
+            "words": [
+                {"word": " one", "start": 0.0, "end": 1.0},
+                {"word": " two", "start": 8.0, "end": 9.0},
+            ],
+        }
+
+        result = split_long_segments([segment], max_chars=40, max_duration=7.0)
+
+        self.assertEqual(
+            [(seg["text"], seg["start"], seg["end"]) for seg in result],
+            [("one", 0.0, 1.0), ("two", 8.0, 9.0)],
+        )
+
+    def test_short_segment_is_kept_as_is(self) -> None:
+        segment = {"text": "short", "start": 0.0, "end": 1.0, "words": []}
+
+        self.assertEqual(split_long_segments([segment]), [segment])
+
+
+class TestFillTranscriptionGaps(unittest.TestCase):
+
+    def test_inserts_placeholders_and_logs_one_summary(self) -> None:
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "a"},
+            {"start": 7.0, "end": 8.0, "text": "b"},
+            {"start": 9.0, "end": 10.0, "text": "c"},
+            {"start": 20.0, "end": 21.0, "text": "d"},
+        ]
+
+        with self.assertLogs(level="WARNING") as logs:
+            filled = fill_transcription_gaps(segments)
+
+        self.assertEqual(
+            [(seg["text"], seg["start"], seg["end"]) for seg in filled],
+            [
+                ("a", 0.0, 1.0),
+                ("[no speech]", 1.0, 7.0),
+                ("b", 7.0, 8.0),
+                ("c", 9.0, 10.0),
+                ("[no speech]", 10.0, 20.0),
+                ("d", 20.0, 21.0),
+            ],
+        )
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("2 gap(s) totaling 16.00s (longest 10.00s)", logs.output[0])
+
+    def test_no_gaps_returns_segments_unchanged(self) -> None:
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "a"},
+            {"start": 1.5, "end": 2.0, "text": "b"},
+        ]
+
+        self.assertEqual(fill_transcription_gaps(segments), segments)
+        self.assertEqual(fill_transcription_gaps([]), [])
+
+
+class TestAdjustSubtitleTiming(unittest.TestCase):
+
+    def test_extends_to_next_start_minus_buffer_and_clamps(self) -> None:
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "a"},
+            {"start": 3.0, "end": 3.5, "text": "b"},
+            {"start": 3.05, "end": 4.0, "text": "c"},
+        ]
+
+        adjusted = adjust_subtitle_timing(segments, 0.1)
+
+        self.assertEqual(
+            [(seg["start"], seg["end"]) for seg in adjusted],
+            [(0.0, 2.9), (3.0, 3.0), (3.05, 4.0)],
+        )
+        self.assertEqual(segments[0]["end"], 1.0)
+
+    def test_empty_segments(self) -> None:
+        self.assertEqual(adjust_subtitle_timing([], 0.1), [])
+
+
+class TestGenerateSrt(unittest.TestCase):
+
+    def test_format_srt_timestamp_rounds_to_nearest_millisecond(self) -> None:
+        self.assertEqual(_format_srt_timestamp(0.0), "00:00:00,000")
+        self.assertEqual(_format_srt_timestamp(2.3), "00:00:02,300")
+        self.assertEqual(_format_srt_timestamp(1.001), "00:00:01,001")
+        self.assertEqual(_format_srt_timestamp(1.005), "00:00:01,005")
+        self.assertEqual(_format_srt_timestamp(3723.456), "01:02:03,456")
+
+    def test_generate_srt_writes_numbered_blocks(self) -> None:
+        segments = [
+            {"start": 0.0, "end": 1.5, "text": "你好"},
+            {"start": 61.25, "end": 62.0, "text": "世界"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "out.srt")
+            with patch("builtins.print"):
+                generate_srt(segments, path)
+            with open(path, encoding="utf-8") as srt:
+                content = srt.read()
+
+        self.assertEqual(
+            content,
+            "1\n00:00:00,000 --> 00:00:01,500\n你好\n\n"
+            "2\n00:01:01,250 --> 00:01:02,000\n世界\n\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
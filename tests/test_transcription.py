@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import types
@@ -5,10 +6,39 @@ import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
-from hermecho.transcription import transcribe_audio
+from hermecho import transcription
+from hermecho.transcription import prefetch_whisper_model, transcribe_audio
+
+
+def _fake_segment(text, start, end, words=()):
+    return types.SimpleNamespace(
+        text=text,
+        start=start,
+        end=end,
+        words=[
+            types.SimpleNamespace(word=word, start=word_start, end=word_end)
+            for word, word_start, word_end in words
+        ],
+    )
+
+
+def _fake_faster_whisper(whisper_model):
+    return types.SimpleNamespace(
+        WhisperModel=MagicMock(return_value=whisper_model),
+        BatchedInferencePipeline=MagicMock(side_effect=lambda model: model),
+    )
 
 
 class TestTranscribeAudio(unittest.TestCase):
+    def setUp(self) -> None:
+        transcription._MODEL_CACHE.clear()
+        device_patcher = patch(
+            "hermecho.transcription._select_device", return_value="cpu"
+        )
+        device_patcher.start()
+        self.addCleanup(device_patcher.stop)
+        self.addCleanup(transcription._MODEL_CACHE.clear)
+
     @patch("hermecho.transcription.os.path.exists", return_value=False)
     def test_missing_audio_path_returns_none(self, _mock_exists: MagicMock) -> None:
         out = transcribe_audio("/missing/audio.mp3", model="tiny", language="ko")
@@ -17,19 +47,25 @@ class TestTranscribeAudio(unittest.TestCase):
 
     def test_whisper_transcribe_receives_no_prompt_options(self) -> None:
         mock_whisper_model = MagicMock()
-        segments = [{"start": 0.0, "end": 1.0, "text": "hello"}]
-        mock_whisper_model.transcribe.return_value = {
-            "segments": segments,
-            "language": "ko",
-        }
+        mock_whisper_model.transcribe.return_value = (
+            iter([
+                _fake_segment(
+                    " hello",
+                    0.0,
+                    1.0,
+                    words=[(" hello", 0.0, 1.0)],
+                )
+            ]),
+            types.SimpleNamespace(language="ko"),
+        )
 
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
             path = tmp.name
             tmp.write(b"fake")
 
         try:
-            fake_whisper = types.SimpleNamespace(load_model=MagicMock(return_value=mock_whisper_model))
-            with patch.dict(sys.modules, {"whisper": fake_whisper}):
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}):
                 out = transcribe_audio(
                     path,
                     model="base",
@@ -39,35 +75,304 @@ class TestTranscribeAudio(unittest.TestCase):
         finally:
             os.unlink(path)
 
-        self.assertEqual(out, segments)
-        fake_whisper.load_model.assert_called_once_with("base")
+        self.assertEqual(
+            out,
+            [
+                {
+                    "text": " hello",
+                    "start": 0.0,
+                    "end": 1.0,
+                    "words": [{"word": " hello", "start": 0.0, "end": 1.0}],
+                }
+            ],
+        )
+        fake_faster_whisper.WhisperModel.assert_called_once()
+        self.assertEqual(fake_faster_whisper.WhisperModel.call_args.args, ("base",))
+        self.assertEqual(
+            fake_faster_whisper.WhisperModel.call_args.kwargs["compute_type"],
+            "int8",
+        )
         mock_whisper_model.transcribe.assert_called_once()
         kwargs = mock_whisper_model.transcribe.call_args.kwargs
         self.assertNotIn("initial_prompt", kwargs)
         self.assertNotIn("carry_initial_prompt", kwargs)
         self.assertIsNone(kwargs["language"])
         self.assertEqual(kwargs["temperature"], 0.2)
+        self.assertTrue(kwargs["word_timestamps"])
+        self.assertEqual(kwargs["beam_size"], 1)
+        self.assertEqual(kwargs["batch_size"], 8)
+        self.assertFalse(kwargs["without_timestamps"])
+        fake_faster_whisper.BatchedInferencePipeline.assert_called_once_with(
+            model=mock_whisper_model
+        )
 
     def test_empty_whisper_segments_returns_empty_list(self) -> None:
         mock_whisper_model = MagicMock()
-        mock_whisper_model.transcribe.return_value = {
-            "segments": [],
-            "language": "ko",
-        }
+        mock_whisper_model.transcribe.return_value = (
+            iter([]),
+            types.SimpleNamespace(language="ko"),
+        )
 
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
             path = tmp.name
             tmp.write(b"fake")
 
         try:
-            fake_whisper = types.SimpleNamespace(load_model=MagicMock(return_value=mock_whisper_model))
-            with patch.dict(sys.modules, {"whisper": fake_whisper}):
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}):
                 out = transcribe_audio(path, model="tiny", language="ko")
         finally:
             os.unlink(path)
 
         self.assertEqual(out, [])
 
+    def test_loaded_model_is_reused_across_calls(self) -> None:
+        mock_whisper_model = MagicMock()
+        mock_whisper_model.transcribe.side_effect = lambda *_args, **_kwargs: (
+            iter([_fake_segment("hi", 0.0, 1.0)]),
+            types.SimpleNamespace(language="ko"),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}):
+                transcribe_audio(path, model="tiny", language="ko")
+                transcribe_audio(path, model="tiny", language="ko")
+        finally:
+            os.unlink(path)
+
+        fake_faster_whisper.WhisperModel.assert_called_once()
+        self.assertEqual(mock_whisper_model.transcribe.call_count, 2)
+
+    def test_prefetched_model_is_loaded_once(self) -> None:
+        mock_whisper_model = MagicMock()
+        mock_whisper_model.transcribe.return_value = (
+            iter([_fake_segment("hi", 0.0, 1.0)]),
+            types.SimpleNamespace(language="ko"),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}), \
+                patch("hermecho.transcription.threading.Thread") as thread_cls:
+                prefetch_whisper_model("tiny")
+                thread_cls.call_args.kwargs["target"]()
+                out = transcribe_audio(path, model="tiny", language="ko")
+        finally:
+            os.unlink(path)
+
+        thread_cls.return_value.start.assert_called_once_with()
+        self.assertTrue(thread_cls.call_args.kwargs["daemon"])
+        fake_faster_whisper.WhisperModel.assert_called_once()
+        self.assertEqual(len(out), 1)
+
+    def test_explicit_device_skips_detection_and_uses_whisper_cache(self) -> None:
+        mock_whisper_model = MagicMock()
+        mock_whisper_model.transcribe.return_value = (
+            iter([_fake_segment("hi", 0.0, 1.0)]),
+            types.SimpleNamespace(language="ko"),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}), \
+                patch.dict(os.environ, {"WHISPER_CACHE": "/tmp/whisper-cache"}):
+                transcribe_audio(path, model="tiny", language="ko", device="cuda")
+        finally:
+            os.unlink(path)
+
+        transcription._select_device.assert_not_called()
+        kwargs = fake_faster_whisper.WhisperModel.call_args.kwargs
+        self.assertEqual(kwargs["device"], "cuda")
+        self.assertEqual(kwargs["compute_type"], "float16")
+        self.assertEqual(kwargs["download_root"], "/tmp/whisper-cache")
+
+    def test_compute_type_override_is_passed_to_model(self) -> None:
+        mock_whisper_model = MagicMock()
+        mock_whisper_model.transcribe.return_value = (
+            iter([_fake_segment("hi", 0.0, 1.0)]),
+            types.SimpleNamespace(language="ko"),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}):
+                transcribe_audio(
+                    path,
+                    model="tiny",
+                    language="ko",
+                    compute_type="float32",
+                    batch_size=1,
+                )
+        finally:
+            os.unlink(path)
+
+        self.assertEqual(
+            fake_faster_whisper.WhisperModel.call_args.kwargs["compute_type"],
+            "float32",
+        )
+        self.assertIn(("tiny", "cpu", "float32"), transcription._MODEL_CACHE)
+        fake_faster_whisper.BatchedInferencePipeline.assert_not_called()
+        self.assertNotIn("batch_size", mock_whisper_model.transcribe.call_args.kwargs)
+        self.assertNotIn("without_timestamps", mock_whisper_model.transcribe.call_args.kwargs)
+
+    def test_transcription_emits_progress_while_segments_stream(self) -> None:
+        mock_whisper_model = MagicMock()
+        mock_whisper_model.transcribe.return_value = (
+            iter([
+                _fake_segment("one", 0.0, 4.2),
+                _fake_segment("two", 4.2, 10.0),
+            ]),
+            types.SimpleNamespace(language="ko", duration=10.0),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}), \
+                patch("builtins.print") as mock_print:
+                out = transcribe_audio(path, model="tiny", language="ko")
+        finally:
+            os.unlink(path)
+
+        self.assertEqual([seg["text"] for seg in out], ["one", "two"])
+        events = [
+            json.loads(call.args[0].removeprefix("HERMECHO_PROGRESS "))
+            for call in mock_print.call_args_list
+            if call.args and str(call.args[0]).startswith("HERMECHO_PROGRESS ")
+        ]
+        self.assertEqual(
+            events,
+            [
+                {
+                    "stage": "transcription",
+                    "status": "running",
+                    "message": "Transcribing audio 4/10s",
+                    "current": 4,
+                    "total": 10,
+                    "pct": 40,
+                },
+                {
+                    "stage": "transcription",
+                    "status": "running",
+                    "message": "Transcribing audio 10/10s",
+                    "current": 10,
+                    "total": 10,
+                    "pct": 100,
+                },
+            ],
+        )
+
+
+    def test_unsupported_compute_type_returns_none(self) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = types.SimpleNamespace(
+                WhisperModel=MagicMock(
+                    side_effect=ValueError(
+                        "Requested float16 compute type, but the target device "
+                        "or backend do not support efficient float16 computation."
+                    )
+                )
+            )
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}), \
+                patch("builtins.print") as mock_print:
+                out = transcribe_audio(
+                    path,
+                    model="tiny",
+                    language="ko",
+                    compute_type="float16",
+                )
+        finally:
+            os.unlink(path)
+
+        self.assertIsNone(out)
+        self.assertNotIn(("tiny", "cpu", "float16"), transcription._MODEL_CACHE)
+        self.assertTrue(
+            any(
+                "compute type 'float16'" in str(call.args[0])
+                for call in mock_print.call_args_list
+            )
+        )
+
+    def test_batched_output_drops_silent_and_repetitive_segments(self) -> None:
+        speech = _fake_segment("hello", 0.0, 1.0)
+        speech.no_speech_prob, speech.avg_logprob, speech.compression_ratio = 0.1, -0.3, 1.2
+        silence = _fake_segment("thanks for watching", 1.0, 2.0)
+        silence.no_speech_prob, silence.avg_logprob, silence.compression_ratio = 0.9, -1.4, 1.3
+        confident = _fake_segment("quiet line", 2.0, 3.0)
+        confident.no_speech_prob, confident.avg_logprob, confident.compression_ratio = 0.9, -0.2, 1.1
+        repeated = _fake_segment("ha ha ha ha ha ha", 3.0, 4.0)
+        repeated.no_speech_prob, repeated.avg_logprob, repeated.compression_ratio = 0.1, -0.5, 2.4
+        mock_whisper_model = MagicMock()
+        mock_whisper_model.transcribe.side_effect = lambda *_args, **_kwargs: (
+            iter([speech, silence, confident, repeated]),
+            types.SimpleNamespace(language="ko"),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(mock_whisper_model)
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}):
+                batched = transcribe_audio(path, model="tiny", language="ko")
+                sequential = transcribe_audio(
+                    path, model="tiny", language="ko", batch_size=1
+                )
+        finally:
+            os.unlink(path)
+
+        self.assertEqual([seg["text"] for seg in batched], ["hello", "quiet line"])
+        # The sequential decoder applies the thresholds itself.
+        self.assertEqual(len(sequential), 4)
+
+    def test_unavailable_device_returns_none(self) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+            path = tmp.name
+            tmp.write(b"fake")
+
+        try:
+            fake_faster_whisper = _fake_faster_whisper(MagicMock())
+            fake_faster_whisper.WhisperModel.side_effect = ValueError(
+                "This CTranslate2 package was not compiled with CUDA support"
+            )
+            with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper}), \
+                patch("builtins.print") as mock_print:
+                out = transcribe_audio(path, model="tiny", language="ko", device="cuda")
+        finally:
+            os.unlink(path)
+
+        self.assertIsNone(out)
+        self.assertTrue(
+            any(
+                "device 'cuda'" in str(call.args[0])
+                for call in mock_print.call_args_list
+            )
+        )
 
 if __name__ == "__main__":
     unittest.main()
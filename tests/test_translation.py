@@ -1,11 +1,20 @@
 import json
 import os
 import sys
+import tempfile
+import threading
+import time
 import types
 import unittest
 from unittest.mock import MagicMock, patch
 
-from hermecho.translation import _translate_chunk, translate_segments
+from hermecho.translation import (
+    _TranslationAPIUnavailable,
+    _estimate_tokens,
+    _make_openrouter_client,
+    _translate_chunk,
+    translate_segments,
+)
 
 
 class TestOpenRouterTranslation(unittest.TestCase):
@@ -23,6 +32,12 @@ class TestOpenRouterTranslation(unittest.TestCase):
         self.assertIsNone(usage)
         mock_print.assert_any_call("Error: OPENROUTER_API_KEY is not set.")
 
+    def test_estimate_tokens_weights_hangul_above_ascii(self) -> None:
+        self.assertEqual(_estimate_tokens(""), 0)
+        self.assertEqual(_estimate_tokens("fighting"), 2)
+        self.assertEqual(_estimate_tokens("안녕하세요"), 5)
+        self.assertEqual(_estimate_tokens("OK 안녕"), 3)
+
     def test_translate_chunk_calls_openrouter_chat_completions(self) -> None:
         response = MagicMock()
         response.choices = [
@@ -60,6 +75,7 @@ class TestOpenRouterTranslation(unittest.TestCase):
         openai_module.OpenAI.assert_called_once_with(
             api_key="test-key",
             base_url="https://openrouter.ai/api/v1",
+            max_retries=0,
         )
         client.chat.completions.create.assert_called_once()
         kwargs = client.chat.completions.create.call_args.kwargs
@@ -76,6 +92,88 @@ class TestOpenRouterTranslation(unittest.TestCase):
             },
         )
 
+    def test_translate_chunk_reuses_cached_response(self) -> None:
+        response = MagicMock()
+        response.choices = [
+            types.SimpleNamespace(
+                message=types.SimpleNamespace(
+                    content=json.dumps({"translations": {"0": "你好"}})
+                )
+            )
+        ]
+        response.usage = None
+        client = MagicMock()
+        client.chat.completions.create.return_value = response
+        openai_module = types.SimpleNamespace(OpenAI=MagicMock(return_value=client))
+        segments = [{"start": 0.0, "end": 1.0, "text": "hello"}]
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+            patch.dict(
+                os.environ,
+                {"OPENROUTER_API_KEY": "test-key", "HERMECHO_CACHE_DIR": cache_dir},
+                clear=True,
+            ), \
+            patch.dict(sys.modules, {"openai": openai_module}), \
+            patch("builtins.print"):
+            results = [
+                _translate_chunk(
+                    segments,
+                    target_language="Traditional Chinese (Taiwan)",
+                    translation_model=model,
+                    reference_material=None,
+                    context={},
+                    use_cache=True,
+                )
+                for model in ("model-a", "model-a", "model-b")
+            ]
+            cached_files = os.listdir(os.path.join(cache_dir, "translations"))
+
+        self.assertEqual([translated for translated, _ in results], [["你好"]] * 3)
+        self.assertIsNone(results[1][1])
+        # The repeat request is served from disk; a different model is not.
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+        self.assertEqual(len(cached_files), 2)
+
+    def test_translate_chunk_does_not_cache_partial_dict_reply(self) -> None:
+        response = MagicMock()
+        response.choices = [
+            types.SimpleNamespace(
+                message=types.SimpleNamespace(
+                    content=json.dumps({"translations": {"0": "a"}})
+                )
+            )
+        ]
+        response.usage = None
+        client = MagicMock()
+        client.chat.completions.create.return_value = response
+        openai_module = types.SimpleNamespace(OpenAI=MagicMock(return_value=client))
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(3)
+        ]
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+            patch.dict(
+                os.environ,
+                {"OPENROUTER_API_KEY": "test-key", "HERMECHO_CACHE_DIR": cache_dir},
+                clear=True,
+            ), \
+            patch.dict(sys.modules, {"openai": openai_module}), \
+            patch("builtins.print"):
+            translated, _ = _translate_chunk(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="model-a",
+                reference_material=None,
+                context={},
+                use_cache=True,
+            )
+            cache_root = os.path.join(cache_dir, "translations")
+            cached_files = os.listdir(cache_root) if os.path.isdir(cache_root) else []
+
+        self.assertEqual(translated, ["a", "", ""])
+        self.assertEqual(cached_files, [])
+
     def test_translate_segments_emits_structured_chunk_progress(self) -> None:
         segments = [
             {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
@@ -86,6 +184,7 @@ class TestOpenRouterTranslation(unittest.TestCase):
             return [f"translated {i}" for i, _ in enumerate(chunk)], None
 
         with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
             patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
             patch("builtins.print") as mock_print:
             translated = translate_segments(
@@ -126,6 +225,121 @@ class TestOpenRouterTranslation(unittest.TestCase):
             events,
         )
 
+    def test_translate_segments_runs_chunks_concurrently_in_order(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(400)
+        ]
+        # Both chunks must be in flight together to get past the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            barrier.wait()
+            return [f"{seg['text']} translated" for seg in chunk], {"total_tokens": 1}
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("builtins.print") as mock_print:
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+                concurrency=2,
+            )
+
+        self.assertEqual(
+            [seg["text"] for seg in translated],
+            [f"line {i} translated" for i in range(400)],
+        )
+        mock_print.assert_any_call(
+            "Translation API tokens — cumulative (reported chunks): total_tokens=2"
+        )
+
+    def test_translate_segments_reports_chunks_as_they_complete(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(400)
+        ]
+        second_chunk_reported = threading.Event()
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            if chunk[0]["text"] == "line 0":
+                # The first chunk is the straggler; it finishes only after
+                # the second chunk's completion has been reported.
+                self.assertTrue(second_chunk_reported.wait(timeout=5))
+            return [seg["text"] for seg in chunk], None
+
+        def record_print(*args, **_kwargs):
+            if args and "Translated chunk 2/2" in str(args[0]):
+                second_chunk_reported.set()
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("builtins.print", side_effect=record_print) as mock_print:
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+                concurrency=2,
+            )
+
+        completed = [
+            json.loads(call.args[0].removeprefix("HERMECHO_PROGRESS "))["message"]
+            for call in mock_print.call_args_list
+            if call.args
+            and call.args[0].startswith("HERMECHO_PROGRESS ")
+            and '"status": "complete"' in call.args[0]
+            and "Translated chunk" in call.args[0]
+        ]
+        self.assertEqual(completed, ["Translated chunk 2/2", "Translated chunk 1/2"])
+        self.assertEqual(
+            [seg["text"] for seg in translated],
+            [f"line {i}" for i in range(400)],
+        )
+
+    def test_failed_chunk_splits_into_concurrent_sub_chunks(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(200)
+        ]
+        # All four size-50 sub-chunks must be in flight together.
+        barrier = threading.Barrier(4, timeout=5)
+        calls = []
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            calls.append(len(chunk))
+            if len(chunk) == 200:
+                return None, {"total_tokens": 1}
+            if len(chunk) == 50:
+                barrier.wait()
+            if len(chunk) == 50 and chunk[0]["text"] == "line 50":
+                return None, None
+            return [f"t{seg['start']:.0f}" for seg in chunk], {"total_tokens": 1}
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("hermecho.translation.tqdm.write"), \
+            patch("builtins.print"):
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+                concurrency=4,
+            )
+
+        texts = [seg["text"] for seg in translated]
+        self.assertEqual(texts[:50], [f"t{i}" for i in range(50)])
+        # The failed sub-chunk was split again into size-10 mini-chunks.
+        self.assertEqual(texts[50:100], [f"t{i}" for i in range(50, 100)])
+        self.assertEqual(texts[100:], [f"t{i}" for i in range(100, 200)])
+        self.assertEqual(sorted(calls), [10] * 5 + [50] * 4 + [200])
+
     def test_translate_segments_retries_single_batch_before_fallback(self) -> None:
         response = MagicMock()
         response.choices = [
@@ -163,10 +377,277 @@ class TestOpenRouterTranslation(unittest.TestCase):
         ])
         self.assertEqual(translated[0]["text"], "你好 世界")
 
+    def test_sliding_window_passes_overlap_context(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(400)
+        ]
+        contexts = {}
+
+        def fake_translate_chunk(chunk, _language, _model, _reference, context, **_kwargs):
+            contexts[chunk[0]["text"]] = context
+            return [seg["text"] for seg in chunk], None
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("builtins.print"):
+            translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+            )
+
+        self.assertEqual(
+            contexts["line 0"],
+            {"prev": "", "next": "line 200\nline 201\nline 202"},
+        )
+        self.assertEqual(
+            contexts["line 200"],
+            {"prev": "line 197\nline 198\nline 199", "next": ""},
+        )
+
+    def test_client_leaves_retries_to_translate_chunk(self) -> None:
+        openai_module = types.SimpleNamespace(OpenAI=MagicMock())
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True), \
+            patch.dict(sys.modules, {"openai": openai_module}):
+            _make_openrouter_client()
+
+        # SDK retries would multiply _MAX_TRANSLATION_ATTEMPTS per chunk.
+        self.assertEqual(openai_module.OpenAI.call_args.kwargs["max_retries"], 0)
+
+    def test_translate_chunk_raises_after_persistent_rate_limits(self) -> None:
+        class RateLimitError(Exception):
+            pass
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = RateLimitError("429")
+        openai_module = types.SimpleNamespace(
+            OpenAI=MagicMock(return_value=client),
+            RateLimitError=RateLimitError,
+        )
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True), \
+            patch.dict(sys.modules, {"openai": openai_module}), \
+            patch("hermecho.translation.time.sleep"), \
+            patch("builtins.print"), \
+            self.assertRaises(_TranslationAPIUnavailable) as raised:
+            _translate_chunk(
+                [{"start": 0.0, "end": 1.0, "text": "hello"}],
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+                context={},
+            )
+
+        self.assertFalse(raised.exception.timed_out)
+        self.assertEqual(client.chat.completions.create.call_count, 3)
+        self.assertEqual(
+            client.chat.completions.create.call_args.kwargs["timeout"],
+            300.0,
+        )
+
+    def test_translate_chunk_flags_persistent_timeouts(self) -> None:
+        class APIConnectionError(Exception):
+            pass
+
+        class APITimeoutError(APIConnectionError):
+            pass
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = APITimeoutError("timed out")
+        openai_module = types.SimpleNamespace(
+            OpenAI=MagicMock(return_value=client),
+            APIConnectionError=APIConnectionError,
+            APITimeoutError=APITimeoutError,
+        )
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True), \
+            patch.dict(sys.modules, {"openai": openai_module}), \
+            patch("hermecho.translation.time.sleep"), \
+            patch("builtins.print"), \
+            self.assertRaises(_TranslationAPIUnavailable) as raised:
+            _translate_chunk(
+                [{"start": 0.0, "end": 1.0, "text": "hello"}],
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+                context={},
+            )
+
+        self.assertTrue(raised.exception.timed_out)
+
+    def test_unavailable_api_skips_chunk_without_splitting(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(400)
+        ]
+        calls = []
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            calls.append(len(chunk))
+            if chunk[0]["text"] == "line 0":
+                raise _TranslationAPIUnavailable("503", {"total_tokens": 1})
+            return [seg["text"] for seg in chunk], None
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("hermecho.translation.tqdm.write"), \
+            patch("builtins.print"):
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+            )
+
+        self.assertEqual(sorted(calls), [200, 200])
+        texts = [seg["text"] for seg in translated]
+        self.assertEqual(texts[:200], [""] * 200)
+        self.assertEqual(texts[200:], [f"line {i}" for i in range(200, 400)])
+
+    def test_chunk_size_controls_windows_and_fallback_splits(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(60)
+        ]
+        calls = []
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            calls.append(len(chunk))
+            if len(chunk) == 30:
+                return None, None
+            return [seg["text"] for seg in chunk], None
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("hermecho.translation.tqdm.write"), \
+            patch("builtins.print"):
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+                chunk_size=30,
+            )
+
+        # Failed 30-segment chunks skip the 50-segment split and go to 10s.
+        self.assertEqual(sorted(calls), [10] * 6 + [30, 30])
+        self.assertEqual([seg["text"] for seg in translated], [f"line {i}" for i in range(60)])
+
+    def test_single_batch_outage_falls_back_one_window_at_a_time(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(400)
+        ]
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            if len(chunk) == 400:
+                raise _TranslationAPIUnavailable("429", {"total_tokens": 1})
+            with lock:
+                in_flight.append(chunk[0]["text"])
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(chunk[0]["text"])
+            return [seg["text"] for seg in chunk], None
+
+        with patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("builtins.print"):
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+            )
+
+        self.assertEqual(max(max_in_flight), 1)
+        self.assertEqual(
+            [seg["text"] for seg in translated],
+            [f"line {i}" for i in range(400)],
+        )
+
+    def test_single_batch_timeout_falls_back_to_concurrent_windows(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(400)
+        ]
+        # Both 200-segment windows must be in flight together.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_translate_chunk(chunk, *_args, **_kwargs):
+            if len(chunk) == 400:
+                raise _TranslationAPIUnavailable("timed out", None, timed_out=True)
+            barrier.wait()
+            return [seg["text"] for seg in chunk], None
+
+        with patch("hermecho.translation._make_openrouter_client"), \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("builtins.print"):
+            translated = translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+            )
+
+        self.assertEqual(
+            [seg["text"] for seg in translated],
+            [f"line {i}" for i in range(400)],
+        )
+
+    def test_translate_segments_shares_one_client_across_chunks(self) -> None:
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": f"line {i}"}
+            for i in range(450)
+        ]
+        clients = []
+
+        def fake_translate_chunk(chunk, *_args, client=None, **_kwargs):
+            clients.append(client)
+            return [seg["text"] for seg in chunk], None
+
+        with patch("hermecho.translation.TOKEN_THRESHOLD", 1), \
+            patch("hermecho.translation._make_openrouter_client") as make_client, \
+            patch("hermecho.translation._translate_chunk", side_effect=fake_translate_chunk), \
+            patch("builtins.print"):
+            translate_segments(
+                segments,
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+            )
+
+        make_client.assert_called_once_with()
+        self.assertEqual(clients, [make_client.return_value] * 3)
+
+    def test_translate_segments_without_api_key_returns_none(self) -> None:
+        with patch.dict(os.environ, {}, clear=True), \
+            patch("hermecho.translation._translate_chunk") as translate_chunk, \
+            patch("builtins.print") as mock_print:
+            translated = translate_segments(
+                [{"start": 0.0, "end": 1.0, "text": "hello"}],
+                target_language="Traditional Chinese (Taiwan)",
+                translation_model="test-model",
+                reference_material=None,
+            )
+
+        self.assertIsNone(translated)
+        translate_chunk.assert_not_called()
+        mock_print.assert_any_call("Error: OPENROUTER_API_KEY is not set.")
+
     def test_translate_segments_preserves_punctuation_only_when_requested(self) -> None:
         segments = [{"start": 0.0, "end": 1.0, "text": "hello"}]
 
-        with patch(
+        with patch("hermecho.translation._make_openrouter_client"), patch(
             "hermecho.translation._translate_chunk",
             return_value=(["你好，世界。"], None),
         ):
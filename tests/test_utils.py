@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hermecho.utils import _read_reference_file, load_reference_material
+
+
+class TestLoadReferenceMaterial(unittest.TestCase):
+    def setUp(self) -> None:
+        _read_reference_file.cache_clear()
+        self.addCleanup(_read_reference_file.cache_clear)
+
+    def test_missing_file_returns_none(self) -> None:
+        with patch("builtins.print") as mock_print:
+            self.assertIsNone(load_reference_material("/missing/reference.md"))
+
+        mock_print.assert_called_once_with(
+            "Warning: Reference file not found at /missing/reference.md"
+        )
+
+    def test_unchanged_file_is_read_once_and_edits_are_reloaded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "reference.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("윤서연 -> Yoon SeoYeon")
+
+            self.assertEqual(load_reference_material(path), "윤서연 -> Yoon SeoYeon")
+            self.assertEqual(load_reference_material(path), "윤서연 -> Yoon SeoYeon")
+            self.assertEqual(_read_reference_file.cache_info().misses, 1)
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("김유연 -> Kim YooYeon")
+            mtime = os.path.getmtime(path) + 1
+            os.utime(path, (mtime, mtime))
+
+            self.assertEqual(load_reference_material(path), "김유연 -> Kim YooYeon")
+
+
+if __name__ == "__main__":
+    unittest.main()
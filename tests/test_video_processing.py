@@ -11,7 +11,11 @@ from hermecho.video_processing import (
     _build_subtitle_style_options,
     _build_subtitles_filter,
     _ffmpeg_supports_subtitles_filter,
+    _h264_encoder_works,
+    _select_h264_encoder,
     burn_subtitles_into_video,
+    extract_audio,
+    is_ffmpeg_installed,
 )
 
 
@@ -72,9 +76,130 @@ class TestFfmpegCapabilityDetection(unittest.TestCase):
         )
         self.assertFalse(_ffmpeg_supports_subtitles_filter())
 
+    @patch("hermecho.video_processing.subprocess.run")
+    @patch("hermecho.video_processing.shutil.which", return_value="/usr/bin/ffmpeg")
+    def test_ffmpeg_installed_checks_path_once_without_subprocess(self, mock_which, mock_run) -> None:
+        is_ffmpeg_installed.cache_clear()
+        self.addCleanup(is_ffmpeg_installed.cache_clear)
+
+        self.assertTrue(is_ffmpeg_installed())
+        self.assertTrue(is_ffmpeg_installed())
+
+        mock_which.assert_called_once_with("ffmpeg")
+        mock_run.assert_not_called()
+
+
+class TestAudioExtraction(unittest.TestCase):
+
+    @patch("hermecho.video_processing.os.path.exists", return_value=True)
+    @patch("hermecho.video_processing.subprocess.run")
+    @patch("builtins.print")
+    def test_extracts_16khz_mono_wav_by_default(self, _mock_print, mock_run, _mock_exists) -> None:
+        audio_path = extract_audio("/videos/clip.mp4")
+
+        self.assertEqual(audio_path, "/videos/clip.wav")
+        mock_run.assert_called_once()
+        command = mock_run.call_args.args[0]
+        self.assertEqual(
+            command[command.index("-vn"):],
+            ["-vn", "-map", "a:0", "-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le", "-y", "/videos/clip.wav"],
+        )
+
+    @patch("hermecho.video_processing.os.path.exists", return_value=True)
+    @patch("hermecho.video_processing.subprocess.run")
+    @patch("builtins.print")
+    def test_copy_codec_keeps_source_stream(self, _mock_print, mock_run, _mock_exists) -> None:
+        mock_run.side_effect = [
+            subprocess.CompletedProcess(args=["ffprobe"], returncode=0, stdout="aac\n", stderr=""),
+            subprocess.CompletedProcess(args=["ffmpeg"], returncode=0),
+        ]
+
+        audio_path = extract_audio("/videos/clip.mp4", copy_codec=True)
+
+        self.assertEqual(audio_path, "/videos/clip.m4a")
+        command = mock_run.call_args.args[0]
+        self.assertIn("copy", command)
+        self.assertNotIn("pcm_s16le", command)
+
+
+class TestH264EncoderSelection(unittest.TestCase):
+
+    ENCODERS = (
+        " V....D h264_nvenc           NVIDIA NVENC H.264 encoder\n"
+        " V....D h264_videotoolbox    VideoToolbox H.264 Encoder\n"
+        " V....D libx264              libx264 H.264 / AVC\n"
+    )
+
+    @patch("hermecho.video_processing._h264_encoder_works", return_value=True)
+    @patch("hermecho.video_processing._ffmpeg_encoders_output")
+    def test_auto_prefers_first_working_hardware_encoder(self, mock_encoders, mock_works) -> None:
+        mock_encoders.return_value = self.ENCODERS
+        mock_works.side_effect = lambda encoder, _options: encoder == "h264_videotoolbox"
+
+        encoder, decode_hwaccel, options = _select_h264_encoder("auto")
+
+        self.assertEqual(encoder, "h264_videotoolbox")
+        self.assertEqual(decode_hwaccel, "videotoolbox")
+        self.assertIn("-q:v", options)
+        self.assertEqual(
+            [call.args for call in mock_works.call_args_list],
+            [
+                ("h264_nvenc", ("-preset", "p4", "-cq", "23", "-pix_fmt", "yuv420p")),
+                ("h264_videotoolbox", ("-q:v", "65", "-pix_fmt", "yuv420p")),
+            ],
+        )
+
+    @patch("hermecho.video_processing.subprocess.run")
+    def test_probe_encodes_with_burn_in_options(self, mock_run) -> None:
+        _h264_encoder_works.cache_clear()
+        self.addCleanup(_h264_encoder_works.cache_clear)
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["ffmpeg"])
+
+        self.assertFalse(_h264_encoder_works("h264_videotoolbox", ("-q:v", "65")))
+
+        command = mock_run.call_args.args[0]
+        self.assertEqual(
+            command[command.index("-c:v"):],
+            ["-c:v", "h264_videotoolbox", "-q:v", "65", "-f", "null", "-"],
+        )
+
+    @patch("hermecho.video_processing._h264_encoder_works", return_value=True)
+    @patch("hermecho.video_processing._ffmpeg_encoders_output")
+    def test_requested_backend_missing_falls_back_to_libx264(self, mock_encoders, _mock_works) -> None:
+        mock_encoders.return_value = self.ENCODERS
+
+        with patch("builtins.print") as mock_print:
+            encoder, decode_hwaccel, options = _select_h264_encoder("qsv")
+
+        self.assertEqual((encoder, decode_hwaccel), ("libx264", None))
+        self.assertEqual(options, ["-pix_fmt", "yuv420p"])
+        mock_print.assert_called_once()
+
+    @patch("hermecho.video_processing._h264_encoder_works", return_value=False)
+    @patch("hermecho.video_processing._ffmpeg_encoders_output")
+    def test_auto_without_hardware_encoder_keeps_auto_decode(self, mock_encoders, _mock_works) -> None:
+        mock_encoders.return_value = self.ENCODERS
+
+        with patch("builtins.print") as mock_print:
+            encoder, decode_hwaccel, _options = _select_h264_encoder("auto")
+
+        self.assertEqual((encoder, decode_hwaccel), ("libx264", "auto"))
+        mock_print.assert_not_called()
+
+    @patch("hermecho.video_processing._ffmpeg_encoders_output")
+    def test_none_uses_libx264_without_probing(self, mock_encoders) -> None:
+        encoder, decode_hwaccel, _options = _select_h264_encoder("none")
+
+        self.assertEqual((encoder, decode_hwaccel), ("libx264", None))
+        mock_encoders.assert_not_called()
+
 
 class TestSubtitleBurnProgress(unittest.TestCase):
 
+    @patch(
+        "hermecho.video_processing._select_h264_encoder",
+        return_value=("h264_nvenc", "cuda", ["-cq", "23"]),
+    )
     @patch("hermecho.video_processing._ffmpeg_supports_subtitles_filter", return_value=True)
     @patch("hermecho.video_processing._video_duration_seconds", return_value=10.0)
     @patch("hermecho.video_processing.subprocess.Popen")
@@ -85,6 +210,7 @@ class TestSubtitleBurnProgress(unittest.TestCase):
         mock_popen,
         _mock_duration,
         _mock_filter,
+        mock_select_encoder,
     ) -> None:
         process = types.SimpleNamespace(
             stdout=[
@@ -107,6 +233,10 @@ class TestSubtitleBurnProgress(unittest.TestCase):
 
         command = mock_popen.call_args.args[0]
         self.assertIn("fontsdir='/tmp/pingfang'", command[command.index("-vf") + 1])
+        mock_select_encoder.assert_called_once_with("auto")
+        self.assertEqual(command[1:3], ["-hwaccel", "cuda"])
+        self.assertEqual(command[command.index("-c:v") + 1], "h264_nvenc")
+        self.assertIn("-cq", command)
 
         progress_lines = [
             call.args[0]
@@ -138,3 +268,42 @@ class TestSubtitleBurnProgress(unittest.TestCase):
             },
             events,
         )
+
+    @patch(
+        "hermecho.video_processing._select_h264_encoder",
+        return_value=("h264_videotoolbox", "videotoolbox", ["-q:v", "65"]),
+    )
+    @patch("hermecho.video_processing._ffmpeg_supports_subtitles_filter", return_value=True)
+    @patch("hermecho.video_processing._video_duration_seconds", return_value=10.0)
+    @patch("hermecho.video_processing.subprocess.Popen")
+    @patch("builtins.print")
+    def test_failed_hardware_burn_retries_with_libx264(
+        self,
+        mock_print,
+        mock_popen,
+        _mock_duration,
+        _mock_filter,
+        _mock_select_encoder,
+    ) -> None:
+        mock_popen.side_effect = [
+            types.SimpleNamespace(
+                stdout=[],
+                stderr=["qscale not available\n"],
+                returncode=1,
+                wait=lambda: None,
+            ),
+            types.SimpleNamespace(
+                stdout=["progress=end\n"],
+                stderr=[],
+                returncode=0,
+                wait=lambda: None,
+            ),
+        ]
+
+        burn_subtitles_into_video("/tmp/in.mp4", "/tmp/subs.srt", "/tmp/out.mp4")
+
+        self.assertEqual(mock_popen.call_count, 2)
+        retry_command = mock_popen.call_args.args[0]
+        self.assertNotIn("-hwaccel", retry_command)
+        self.assertEqual(retry_command[retry_command.index("-c:v") + 1], "libx264")
+        mock_print.assert_any_call("Successfully burned subtitles into the video.")